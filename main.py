@@ -4,22 +4,34 @@ FastAPI backend with Howard 7-dimension model, IRT-CAT, friction detection
 FIXED VERSION - Uses include_router instead of mount
 """
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+import asyncio
+import logging
 import sys
 import os
 
+import orjson
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger("gruenderai")
+
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 # Import router (FIXED: Changed from 'app' to 'router')
-from api.assessment_api import router as assessment_router
+from api.assessment_api import router as assessment_router, get_engine
+from api.session_store import create_session_store
+from api.database_pool import create_db_pool
 
 # Create main app
 app = FastAPI(
     title="GründerAI Complete Assessment API",
     description="Howard 7-dimension model with IRT-CAT adaptive testing",
-    version="3.0.0"
+    version="3.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS - Must be added BEFORE routes
@@ -31,46 +43,79 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress JSON bodies - tiny responses are not worth the CPU
+app.add_middleware(GZipMiddleware, minimum_size=512)
+
 # Include assessment router with /api prefix (FIXED: Changed from mount to include_router)
 app.include_router(assessment_router, prefix="/api")
 
+# Static bodies are serialized once, not on every request
+_ROOT_BODY = orjson.dumps({
+    "service": "GründerAI Complete Assessment System",
+    "version": "3.0.0",
+    "model": "Howard 7-Dimension Entrepreneurial Personality",
+    "features": [
+        "IRT-CAT Adaptive Testing",
+        "Friction Analysis",
+        "Contextual Scoring",
+        "Database Integration",
+        "Session Management"
+    ],
+    "status": "ready"
+})
+
 @app.get("/")
 async def root():
-    return {
-        "service": "GründerAI Complete Assessment System",
-        "version": "3.0.0",
-        "model": "Howard 7-Dimension Entrepreneurial Personality",
-        "features": [
-            "IRT-CAT Adaptive Testing",
-            "Friction Analysis",
-            "Contextual Scoring",
-            "Database Integration",
-            "Session Management"
-        ],
-        "status": "ready"
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 @app.get("/health")
 async def health_check():
-    return {
-        "status": "healthy",
-        "api_version": "3.0.0",
-        "endpoints_registered": len(app.routes)
-    }
+    # Body is built at startup - the route table is fixed by then
+    return Response(content=app.state.health_body, media_type="application/json")
+
+def _log_engine_warmup(future: asyncio.Future):
+    """Retrieve the warmup result so a failed engine load is logged instead of lost"""
+    if future.cancelled():
+        return
+    error = future.exception()
+    if error is not None:
+        logger.error("❌ Assessment engine failed to load: %s", error)
 
-# Debug: Print all registered routes on startup
+# Debug: Log all registered routes on startup
 @app.on_event("startup")
 async def startup_event():
-    print("🚀 GründerAI API Starting...")
-    print("📋 Registered Routes:")
+    logger.info("🚀 GründerAI API Starting...")
+    app.state.sessions = create_session_store()
+    app.state.db = await create_db_pool()
+    # Load the assessment engine in a worker thread while the server comes up
+    app.state.engine_warmup = asyncio.get_running_loop().run_in_executor(None, get_engine)
+    app.state.engine_warmup.add_done_callback(_log_engine_warmup)
+    app.state.health_body = orjson.dumps({
+        "status": "healthy",
+        "api_version": "3.0.0",
+        "endpoints_registered": len(app.routes)
+    })
+    logger.info("📋 Registered Routes:")
     for route in app.routes:
         if hasattr(route, 'methods'):
-            methods = ', '.join(route.methods)
-            print(f"   {methods:8} {route.path}")
-    print("✅ API Ready!")
+            logger.info("   %-8s %s", ', '.join(route.methods), route.path)
+    logger.info("✅ API Ready!")
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await app.state.sessions.close()
+    if app.state.db is not None:
+        await app.state.db.close()
 
 if __name__ == "__main__":
     import uvicorn
     port = int(os.environ.get("PORT", 8000))
-    print(f"🌐 Starting server on port {port}")
-    uvicorn.run(app, host="0.0.0.0", port=port)
\ No newline at end of file
+    logger.info("🌐 Starting server on port %s", port)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=port,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.environ.get("WEB_CONCURRENCY", 1))
+    )
\ No newline at end of file
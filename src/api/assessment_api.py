@@ -3,30 +3,49 @@ GründerAI Assessment API
 FIXED VERSION - Exports APIRouter for proper integration
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
+from functools import lru_cache
+import logging
 import sys
 import os
+import uuid
+
+import orjson
+
+logger = logging.getLogger(__name__)
 
 # Add our assessment engine to Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-# Import our engine (optional - will work without it for now)
-try:
-    from assessment_engine.pure_python_irt import GruenderAIEngine
+@lru_cache(maxsize=1)
+def get_engine():
+    """Load our engine on first use (optional - will work without it for now)"""
+    try:
+        from assessment_engine.pure_python_irt import GruenderAIEngine
+    except ImportError as e:
+        logger.warning("⚠️ Could not load full engine: %s", e)
+        return None
     engine = GruenderAIEngine()
-    print("✅ Assessment engine loaded successfully")
-except ImportError as e:
-    print(f"⚠️ Warning: Could not load full engine: {e}")
-    engine = None
+    logger.info("✅ Assessment engine loaded successfully")
+    return engine
+
+try:
+    from .session_store import create_session_store
+except ImportError:
+    from session_store import create_session_store
 
 # Create API Router (FIXED: Changed from FastAPI app to APIRouter)
 router = APIRouter(
     tags=["assessment"],
     responses={404: {"description": "Not found"}},
+    default_response_class=ORJSONResponse,
 )
 
 # Request/Response models
+# Response models only document the OpenAPI schema - handlers return plain
+# dicts, so responses are not re-validated on the way out
 class StartAssessmentRequest(BaseModel):
     user_id: str
     business_type: str  # "restaurant", "ecommerce", "consulting"
@@ -46,19 +65,39 @@ class SubmitResponseResponse(BaseModel):
     success: bool
     data: dict
 
+def get_session_store(request: Request):
+    """Session store created at app startup (created lazily if the app has no startup hook)"""
+    store = getattr(request.app.state, "sessions", None)
+    if store is None:
+        store = request.app.state.sessions = create_session_store()
+    return store
+
 # API endpoints - Note: paths are relative to router, /api prefix added in main.py
 
-@router.get("/assessment/health")
-async def assessment_health():
-    """Check assessment system health"""
-    return {
+# Health bodies serialized once, keyed by whether the engine is loaded
+_ASSESSMENT_HEALTH_BODIES = {
+    engine_loaded: orjson.dumps({
         "status": "healthy",
-        "engine_loaded": engine is not None,
+        "engine_loaded": engine_loaded,
         "version": "3.0.0"
-    }
+    })
+    for engine_loaded in (False, True)
+}
+
+def _engine_loaded(request: Request) -> bool:
+    """Whether the startup warmup finished loading the engine - never loads it on the event loop"""
+    warmup = getattr(request.app.state, "engine_warmup", None)
+    if warmup is None or not warmup.done() or warmup.cancelled() or warmup.exception() is not None:
+        return False
+    return warmup.result() is not None
+
+@router.get("/assessment/health")
+async def assessment_health(request: Request):
+    """Check assessment system health"""
+    return Response(content=_ASSESSMENT_HEALTH_BODIES[_engine_loaded(request)], media_type="application/json")
 
-@router.post("/assessment/start", response_model=StartAssessmentResponse)
-async def start_assessment(request: StartAssessmentRequest):
+@router.post("/assessment/start", responses={200: {"model": StartAssessmentResponse}})
+async def start_assessment(request: StartAssessmentRequest, sessions=Depends(get_session_store)):
     """
     Start new personality assessment
     
@@ -71,12 +110,23 @@ async def start_assessment(request: StartAssessmentRequest):
     }
     """
     try:
-        print(f"📝 Starting assessment for user: {request.user_id}")
-        print(f"   Business type: {request.business_type}")
+        logger.debug("Starting assessment for user: %s (business type: %s)",
+                     request.user_id, request.business_type)
         
         # Generate session ID
-        import uuid
         session_id = str(uuid.uuid4())
+        business_context = {
+            "type": request.business_type,
+            "industry": request.industry,
+            "location": request.location
+        }
+        
+        await sessions.create(session_id, {
+            "session_id": session_id,
+            "user_id": request.user_id,
+            "business_context": business_context,
+            "status": "active"
+        })
         
         # Return success response
         return {
@@ -84,21 +134,17 @@ async def start_assessment(request: StartAssessmentRequest):
             "data": {
                 "session_id": session_id,
                 "message": "Assessment started successfully",
-                "business_context": {
-                    "type": request.business_type,
-                    "industry": request.industry,
-                    "location": request.location
-                },
+                "business_context": business_context,
                 "next_steps": "Use /assessment/respond to submit answers"
             }
         }
         
     except Exception as e:
-        print(f"❌ Error starting assessment: {e}")
+        logger.error("Error starting assessment: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.post("/assessment/respond", response_model=SubmitResponseResponse)
-async def submit_response(request: SubmitResponseRequest):
+@router.post("/assessment/respond", responses={200: {"model": SubmitResponseResponse}})
+async def submit_response(request: SubmitResponseRequest, sessions=Depends(get_session_store)):
     """
     Submit assessment response
     
@@ -110,40 +156,44 @@ async def submit_response(request: SubmitResponseRequest):
     }
     """
     try:
-        print(f"📝 Recording response for session: {request.session_id}")
-        
-        return {
-            "success": True,
-            "data": {
-                "session_id": request.session_id,
-                "response_recorded": True,
-                "next_question": {
-                    "item_id": "SAMPLE_NEXT",
-                    "text": "Sample next question would appear here"
-                }
-            }
-        }
+        logger.debug("Recording response for session: %s", request.session_id)
         
+        recorded = await sessions.record_response(request.session_id, request.item_id, request.response_value)
     except Exception as e:
-        print(f"❌ Error submitting response: {e}")
+        logger.error("Error submitting response: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
+    
+    if not recorded:
+        raise HTTPException(status_code=404, detail="Session not found")
+    
+    return {
+        "success": True,
+        "data": {
+            "session_id": request.session_id,
+            "response_recorded": True,
+            "next_question": {
+                "item_id": "SAMPLE_NEXT",
+                "text": "Sample next question would appear here"
+            }
+        }
+    }
 
 @router.get("/assessment/session/{session_id}")
-async def get_session(session_id: str):
+async def get_session(session_id: str, sessions=Depends(get_session_store)):
     """Get assessment session details"""
+    state = await sessions.get(session_id)
+    if state is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+    
     return {
         "success": True,
         "data": {
             "session_id": session_id,
-            "status": "active",
-            "items_completed": 0,
+            "status": state["status"],
+            "business_context": state["business_context"],
+            "items_completed": len(state["responses"]),
             "estimated_time_remaining": "15 minutes"
         }
     }
 
-# For backward compatibility if someone imports this as an app
-from fastapi import FastAPI
-app = FastAPI()
-app.include_router(router)
-
-print("✅ Assessment API router initialized")
\ No newline at end of file
+logger.debug("✅ Assessment API router initialized")
\ No newline at end of file
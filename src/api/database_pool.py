@@ -0,0 +1,44 @@
+"""
+GründerAI Database Pool
+Shared asyncpg connection pool, created once at app startup
+"""
+
+import logging
+import os
+
+from fastapi import HTTPException, Request
+
+# asyncpg is optional - without DATABASE_URI or the driver the API runs without Postgres
+try:
+    import asyncpg
+    ASYNCPG_AVAILABLE = True
+except ImportError:
+    asyncpg = None
+    ASYNCPG_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+async def create_db_pool():
+    """Connection pool for DATABASE_URI, or None if no database is configured"""
+    dsn = os.environ.get("DATABASE_URI")
+    if not dsn:
+        return None
+
+    if not ASYNCPG_AVAILABLE:
+        logger.warning("⚠️ DATABASE_URI set but asyncpg is not installed - running without database pool")
+        return None
+
+    pool = await asyncpg.create_pool(dsn=dsn, min_size=5, max_size=20, command_timeout=30)
+    logger.info("✅ Database pool ready")
+    return pool
+
+
+async def get_conn(request: Request):
+    """FastAPI dependency: one pooled connection for the duration of a request"""
+    pool = getattr(request.app.state, "db", None)
+    if pool is None:
+        raise HTTPException(status_code=503, detail="Database not configured")
+
+    async with pool.acquire() as conn:
+        yield conn
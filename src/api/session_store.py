@@ -0,0 +1,142 @@
+"""
+GründerAI Session Store
+Assessment session state in Redis (shared across workers) with an in-process fallback
+"""
+
+import logging
+import os
+import time
+
+import orjson
+
+# Redis is optional - without REDIS_URL or the client library sessions stay in-process
+try:
+    import redis.asyncio as redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    redis = None
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+SESSION_TTL_SECONDS = 1800  # 30 min idle
+SWEEP_INTERVAL_SECONDS = 60  # In-memory store: drop expired sessions at most once a minute
+
+# Existence check and write in one atomic step - a session expiring in between must not
+# leave an orphaned response hash behind. KEYS: session, responses; ARGV: item, value, ttl
+_RECORD_RESPONSE_LUA = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+redis.call('HSET', KEYS[2], ARGV[1], ARGV[2])
+redis.call('EXPIRE', KEYS[2], ARGV[3])
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+return 1
+"""
+
+
+class RedisSessionStore:
+    """Session blob under sess:{id}, responses in the hash sess:{id}:resp"""
+
+    def __init__(self, client, ttl=SESSION_TTL_SECONDS):
+        self.client = client
+        self.ttl = ttl
+        self._record_response = client.register_script(_RECORD_RESPONSE_LUA)
+
+    async def create(self, session_id, state):
+        """Store a new session state"""
+        await self.client.set(f"sess:{session_id}", orjson.dumps(state), ex=self.ttl)
+
+    async def get(self, session_id):
+        """Session state with its recorded responses, or None if unknown/expired"""
+        key = f"sess:{session_id}"
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.get(key)
+            pipe.hgetall(f"{key}:resp")
+            pipe.expire(key, self.ttl)
+            pipe.expire(f"{key}:resp", self.ttl)
+            raw, responses, _, _ = await pipe.execute()
+
+        if raw is None:
+            return None
+
+        state = orjson.loads(raw)
+        state["responses"] = {item_id.decode(): int(value) for item_id, value in responses.items()}
+        return state
+
+    async def record_response(self, session_id, item_id, response_value):
+        """Record one answer in O(1) without rewriting the session blob"""
+        key = f"sess:{session_id}"
+        recorded = await self._record_response(
+            keys=[key, f"{key}:resp"], args=[item_id, response_value, self.ttl]
+        )
+        return bool(recorded)
+
+    async def close(self):
+        await self.client.aclose()
+
+
+class InMemorySessionStore:
+    """Single-process fallback with the same idle TTL semantics"""
+
+    def __init__(self, ttl=SESSION_TTL_SECONDS):
+        self.ttl = ttl
+        self._sessions = {}  # session_id -> (expires_at, state, responses)
+        self._next_sweep = time.monotonic() + SWEEP_INTERVAL_SECONDS
+
+    def _lookup(self, session_id):
+        entry = self._sessions.get(session_id)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del self._sessions[session_id]
+            return None
+        # Refresh idle timeout
+        entry = (time.monotonic() + self.ttl, entry[1], entry[2])
+        self._sessions[session_id] = entry
+        return entry
+
+    def _sweep(self, now):
+        """Drop expired sessions that were never looked up again"""
+        expired = [session_id for session_id, entry in self._sessions.items() if entry[0] < now]
+        for session_id in expired:
+            del self._sessions[session_id]
+        self._next_sweep = now + SWEEP_INTERVAL_SECONDS
+
+    async def create(self, session_id, state):
+        """Store a new session state"""
+        now = time.monotonic()
+        if now >= self._next_sweep:
+            self._sweep(now)
+        self._sessions[session_id] = (now + self.ttl, state, {})
+
+    async def get(self, session_id):
+        """Session state with its recorded responses, or None if unknown/expired"""
+        entry = self._lookup(session_id)
+        if entry is None:
+            return None
+        return {**entry[1], "responses": dict(entry[2])}
+
+    async def record_response(self, session_id, item_id, response_value):
+        """Record one answer"""
+        entry = self._lookup(session_id)
+        if entry is None:
+            return False
+        entry[2][item_id] = response_value
+        return True
+
+    async def close(self):
+        self._sessions.clear()
+
+
+def create_session_store():
+    """Redis store when REDIS_URL is configured, in-memory store otherwise"""
+    redis_url = os.environ.get("REDIS_URL")
+
+    if redis_url and REDIS_AVAILABLE:
+        logger.info("✅ Session store: Redis")
+        return RedisSessionStore(redis.from_url(redis_url, decode_responses=False))
+
+    if redis_url:
+        logger.warning("⚠️ REDIS_URL set but redis is not installed - using in-memory sessions")
+    return InMemorySessionStore()
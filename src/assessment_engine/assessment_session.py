@@ -3,9 +3,17 @@ Interactive Assessment Session Simulator
 Shows how users experience the adaptive IRT-CAT assessment
 """
 
+import numpy as np
+
 from irt_cat_engine import IRTCATEngine
 from sample_items import create_sample_item_bank
 import random
+from bisect import bisect_right
+from collections import defaultdict
+
+# Percentile interpretation: label i covers [_THRESH[i-1], _THRESH[i])
+_THRESH = (20, 40, 60, 80)
+_LABELS = ("Sehr niedrig", "Niedrig", "Mittel", "Hoch", "Sehr hoch")
 
 class AssessmentSession:
     """Simulates a complete user assessment session"""
@@ -15,7 +23,16 @@ class AssessmentSession:
         self.items = create_sample_item_bank()
         self.user_responses = []
         self.theta_estimates = {}
-        self.administered_items = []
+        self.administered_items = set()
+        self.dimensions_asked = set()
+        
+        # Index the item bank once: per-dimension buckets (in bank order) and by id
+        self._items_by_dim = defaultdict(list)
+        self._item_by_id = {}
+        for item in self.items:
+            self._items_by_dim[item.dimension].append(item)
+            self._item_by_id[item.item_id] = item
+        self._remaining_items = dict(self._item_by_id)
         
         # Initialize theta for all dimensions
         for dimension in ["innovativeness", "risk_taking", "achievement_orientation", 
@@ -24,26 +41,24 @@ class AssessmentSession:
     
     def select_next_question(self):
         """Select next question using IRT-CAT logic"""
-        # Find dimension with highest uncertainty (for demo)
-        available_items = [item for item in self.items if item.item_id not in self.administered_items]
+        # First item from a dimension not asked yet (for demo) - nothing of
+        # that dimension was administered, so it is the head of its bucket
+        for dimension, bucket in self._items_by_dim.items():
+            if dimension not in self.dimensions_asked:
+                return bucket[0]
         
-        if not available_items:
+        if not self._remaining_items:
             return None
         
-        # Get dimensions of already administered items
-        administered_item_objects = [item for item in self.items if item.item_id in self.administered_items]
-        dimensions_asked = [item.dimension for item in administered_item_objects]
-        for item in available_items:
-            if item.dimension not in dimensions_asked:
-                return item
-        
         # Fallback: random available item
-        return random.choice(available_items)
+        return random.choice(list(self._remaining_items.values()))
     
     def process_response(self, item, response):
         """Process user response and update estimates"""
         self.user_responses.append((item.item_id, response))
-        self.administered_items.append(item.item_id)
+        self.administered_items.add(item.item_id)
+        self.dimensions_asked.add(item.dimension)
+        self._remaining_items.pop(item.item_id, None)
         
         # Update theta estimate for this dimension
         current_theta = self.theta_estimates[item.dimension]
@@ -54,9 +69,11 @@ class AssessmentSession:
     
     def get_final_scores(self):
         """Convert theta to percentiles for user-friendly results"""
+        thetas = np.fromiter(self.theta_estimates.values(), dtype=np.float64, count=len(self.theta_estimates))
+        percentiles = self.engine.theta_to_percentile_batch(thetas).tolist()
+        
         scores = {}
-        for dimension, theta in self.theta_estimates.items():
-            percentile = self.engine.theta_to_percentile(theta)
+        for (dimension, theta), percentile in zip(self.theta_estimates.items(), percentiles):
             scores[dimension] = {
                 'percentile': percentile,
                 'theta': theta,
@@ -66,16 +83,7 @@ class AssessmentSession:
     
     def interpret_score(self, percentile):
         """Interpret percentile scores"""
-        if percentile >= 80:
-            return "Sehr hoch"
-        elif percentile >= 60:
-            return "Hoch" 
-        elif percentile >= 40:
-            return "Mittel"
-        elif percentile >= 20:
-            return "Niedrig"
-        else:
-            return "Sehr niedrig"
+        return _LABELS[bisect_right(_THRESH, percentile)]
 
 def simulate_assessment():
     """Run interactive assessment simulation"""
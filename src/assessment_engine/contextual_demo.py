@@ -4,6 +4,41 @@ Shows how the same personality performs differently in different business contex
 """
 
 import math
+from bisect import bisect_right
+from dataclasses import dataclass
+from types import MappingProxyType
+
+# Fixed trait order shared by every per-context weight tuple and theta key
+TRAIT_ORDER = (
+    "risk_taking",
+    "innovativeness",
+    "self_efficacy",
+    "achievement_orientation",
+    "proactiveness",
+    "autonomy_orientation",
+    "competitive_aggressiveness",
+)
+
+# Sorted thresholds for bisect_right (">=" cascades): label i covers [thresh[i-1], thresh[i])
+FITNESS_THRESHOLDS = (0.35, 0.5, 0.65, 0.8)
+FITNESS_LEVELS = ("SCHWIERIG", "HERAUSFORDERND", "AUSREICHEND", "GUT", "EXZELLENT")
+CONFIDENCE_THRESHOLDS = (0.5, 0.7)
+CONFIDENCE_LEVELS = ("NIEDRIG", "MODERAT", "HOCH")
+IMPORTANCE_THRESHOLDS = (0.5, 0.65, 0.75)
+IMPORTANCE_LEVELS = ("NIEDRIG", "MODERAT", "HOCH", "KRITISCH")
+PERFORMANCE_THRESHOLDS = (0.5, 0.7)
+PERFORMANCE_LEVELS = ("SCHWACH", "AUSREICHEND", "STARK")
+
+@dataclass(slots=True)
+class TraitResult:
+    """Context-weighted analysis of a single trait"""
+    raw_theta: float
+    normalized_score: float
+    context_weight: float
+    weighted_score: float
+    importance: str
+    performance: str
+    business_impact: float  # 0-100 scale
 
 class GruenderAIContextualDemo:
     """Demonstrates sophisticated contextual trait weighting"""
@@ -84,110 +119,96 @@ class GruenderAIContextualDemo:
                 "market_description": "Digitale Kompetenz erforderlich, hart umkämpft"
             }
         }
+        
+        # Read-only views - the arrays and per-context constants below are derived from these
+        self.trait_weights = MappingProxyType(
+            {context: MappingProxyType(weights) for context, weights in self.trait_weights.items()}
+        )
+        self.business_contexts = MappingProxyType(self.business_contexts)
+        
+        # Per-context constants: (base_prob, compat, weights, importance_labels, critical_flags),
+        # the last three aligned with TRAIT_ORDER. Seven traits are scored with plain floats -
+        # cheaper than NumPy dispatch at this size
+        self._ctx_ctx = {}
+        for context, info in self.business_contexts.items():
+            weights = tuple(self.trait_weights[context][trait] for trait in TRAIT_ORDER)
+            self._ctx_ctx[context] = (
+                info["approval_probability_base"],
+                info["gruendungszuschuss_compatibility"],
+                weights,
+                tuple(IMPORTANCE_LEVELS[bisect_right(IMPORTANCE_THRESHOLDS, weight)] for weight in weights),
+                tuple(weight >= 0.75 for weight in weights)
+            )
     
     def analyze_personality_for_context(self, raw_theta_scores, business_context):
-        """Comprehensive contextual analysis"""
-        context_weights = self.trait_weights[business_context]
-        context_info = self.business_contexts[business_context]
+        """
+        Comprehensive contextual analysis
+        
+        Traits missing from raw_theta_scores are left out of the scoring; keys outside
+        TRAIT_ORDER raise KeyError, like a trait the context has no weight for.
+        """
+        base_prob, compat, weights, importance, critical = self._ctx_ctx[business_context]
         
-        # Calculate context-weighted scores
+        # One slotted record per trait - converted to JSON only at the API boundary
         trait_analysis = {}
         total_weighted_score = 0.0
         total_possible_weight = 0.0
-        critical_trait_performance = []
-        
-        for trait, raw_theta in raw_theta_scores.items():
-            weight = context_weights[trait]
+        critical_sum = 0.0
+        critical_count = 0
+        scored_count = 0
+        get_theta = raw_theta_scores.get
+        for trait, weight, imp, is_critical in zip(TRAIT_ORDER, weights, importance, critical):
+            raw_theta = get_theta(trait)
+            if raw_theta is None:
+                continue  # Partial profiles only score the traits they contain
             normalized_score = (raw_theta + 3.0) / 6.0  # Convert -3/+3 to 0-1
             weighted_score = normalized_score * weight
-            
-            # Determine importance and performance
-            if weight >= 0.75:
-                importance = "KRITISCH"
-            elif weight >= 0.65:
-                importance = "HOCH"
-            elif weight >= 0.5:
-                importance = "MODERAT"
-            else:
-                importance = "NIEDRIG"
-            
-            # Performance assessment
-            if normalized_score >= 0.7:
-                performance = "STARK"
-            elif normalized_score >= 0.5:
-                performance = "AUSREICHEND"
-            else:
-                performance = "SCHWACH"
-            
-            trait_analysis[trait] = {
-                "raw_theta": raw_theta,
-                "normalized_score": normalized_score,
-                "context_weight": weight,
-                "weighted_score": weighted_score,
-                "importance": importance,
-                "performance": performance,
-                "business_impact": normalized_score * weight * 100  # 0-100 scale
-            }
-            
+            trait_analysis[trait] = TraitResult(
+                raw_theta, normalized_score, weight, weighted_score, imp,
+                PERFORMANCE_LEVELS[bisect_right(PERFORMANCE_THRESHOLDS, normalized_score)],
+                weighted_score * 100
+            )
+            scored_count += 1
             total_weighted_score += weighted_score
             total_possible_weight += weight
-            
-            # Track critical traits
-            if weight >= 0.75:
-                critical_trait_performance.append(normalized_score)
+            if is_critical:
+                critical_sum += normalized_score
+                critical_count += 1
         
-        # Calculate business fitness
-        business_fitness = (total_weighted_score / total_possible_weight) if total_possible_weight > 0 else 0.5
-        
-        # Critical traits readiness
-        critical_readiness = sum(critical_trait_performance) / len(critical_trait_performance) if critical_trait_performance else 0.5
+        if scored_count != len(raw_theta_scores):
+            unknown = sorted(trait for trait in raw_theta_scores if trait not in trait_analysis)
+            raise KeyError(f"Unknown traits for context '{business_context}': {', '.join(unknown)}")
         
-        # Adjust fitness based on critical traits
+        # Business fitness, adjusted by the critical traits' readiness
+        business_fitness = (total_weighted_score / total_possible_weight) if total_possible_weight > 0 else 0.5
+        critical_readiness = critical_sum / critical_count if critical_count else 0.5
         adjusted_fitness = business_fitness * 0.7 + critical_readiness * 0.3
         
-        # Fitness level
-        if adjusted_fitness >= 0.8:
-            fitness_level = "EXZELLENT"
-        elif adjusted_fitness >= 0.65:
-            fitness_level = "GUT"
-        elif adjusted_fitness >= 0.5:
-            fitness_level = "AUSREICHEND"
-        elif adjusted_fitness >= 0.35:
-            fitness_level = "HERAUSFORDERND"
-        else:
-            fitness_level = "SCHWIERIG"
-        
         # Gründungszuschuss probability
-        base_prob = context_info["approval_probability_base"]
         fitness_adjustment = (adjusted_fitness - 0.5) * 0.4
-        compatibility_bonus = (context_info["gruendungszuschuss_compatibility"] - 0.7) * 0.1
-        
+        compatibility_bonus = (compat - 0.7) * 0.1
         gruendungszuschuss_prob = max(0.25, min(0.95, base_prob + fitness_adjustment + compatibility_bonus))
         
         return {
             "business_context": business_context,
             "business_fitness": {
                 "score": adjusted_fitness,
-                "level": fitness_level,
+                "level": FITNESS_LEVELS[bisect_right(FITNESS_THRESHOLDS, adjusted_fitness)],
                 "raw_weighted_score": business_fitness,
                 "critical_traits_readiness": critical_readiness
             },
             "gruendungszuschuss": {
                 "probability": gruendungszuschuss_prob,
-                "confidence": "HOCH" if gruendungszuschuss_prob >= 0.7 else "MODERAT" if gruendungszuschuss_prob >= 0.5 else "NIEDRIG"
+                "confidence": CONFIDENCE_LEVELS[bisect_right(CONFIDENCE_THRESHOLDS, gruendungszuschuss_prob)]
             },
             "trait_analysis": trait_analysis,
-            "context_info": context_info
+            "context_info": dict(self.business_contexts[business_context])
         }
     
     def compare_contexts(self, raw_theta_scores, contexts_to_compare):
         """Compare the same personality across multiple business contexts"""
-        results = {}
-        
-        for context in contexts_to_compare:
-            results[context] = self.analyze_personality_for_context(raw_theta_scores, context)
-        
-        return results
+        return {context: self.analyze_personality_for_context(raw_theta_scores, context)
+                for context in contexts_to_compare}
     
     def generate_recommendations(self, comparison_results):
         """Generate business recommendations based on context comparison"""
@@ -226,13 +247,16 @@ class GruenderAIContextualDemo:
         
         return recommendations
 
+# Process-wide shared engine - import this instead of instantiating per request
+CONTEXTUAL_ENGINE = GruenderAIContextualDemo()
+
 # Demonstration
 if __name__ == "__main__":
     print("🎯 GründerAI Contextual Intelligence Demonstration")
     print("=" * 80)
     
     # Initialize the engine
-    engine = GruenderAIContextualDemo()
+    engine = CONTEXTUAL_ENGINE
     
     # Test personality profile: High autonomy entrepreneur
     entrepreneur_profile = {
@@ -266,13 +290,13 @@ if __name__ == "__main__":
         print(f"   Beschreibung: {analysis['context_info']['market_description']}")
         
         # Show top traits for this context
-        trait_impacts = [(trait, data['business_impact']) for trait, data in analysis['trait_analysis'].items()]
+        trait_impacts = [(trait, data.business_impact) for trait, data in analysis['trait_analysis'].items()]
         trait_impacts.sort(key=lambda x: x[1], reverse=True)
         
         print(f"   Top Trait Impacts:")
         for trait, impact in trait_impacts[:3]:
             trait_data = analysis['trait_analysis'][trait]
-            print(f"     • {trait:20}: {impact:4.0f}/100 ({trait_data['importance']}, {trait_data['performance']})")
+            print(f"     • {trait:20}: {impact:4.0f}/100 ({trait_data.importance}, {trait_data.performance})")
     
     # Generate recommendations
     recommendations = engine.generate_recommendations(comparison)
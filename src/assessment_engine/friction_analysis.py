@@ -3,10 +3,53 @@ GründerAI Friction Analysis Engine
 Detects problematic trait combinations and generates intervention mandates
 """
 
+import heapq
+import io
 import json
+import logging
 import math
-from typing import Dict, List, Tuple, Optional
-from datetime import datetime
+import sys
+import threading
+from itertools import compress, islice
+from operator import itemgetter
+from typing import Dict, List, Tuple, Optional, Union
+from bisect import bisect_left, bisect_right
+from datetime import date
+from functools import lru_cache
+
+import numpy as np
+
+# orjson is optional - the demo falls back to the stdlib encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+def _intern_strings(obj):
+    """Copy of a nested dict/list/tuple literal with every str key and leaf interned"""
+    if isinstance(obj, str):
+        return sys.intern(obj)
+    if isinstance(obj, dict):
+        return {_intern_strings(key): _intern_strings(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return type(obj)(_intern_strings(value) for value in obj)
+    return obj
+
+
+@lru_cache(maxsize=2)
+def _date_prefix(day: int) -> str:
+    """YYYYMMDD for a date ordinal - mandate ids only change once a day"""
+    return date.fromordinal(day).strftime('%Y%m%d')
+
+
+@lru_cache(maxsize=256)
+def _default_customization(business_context: str) -> Tuple[str, ...]:
+    """Fallback customization notes for a context without specific ones"""
+    return (f"Allgemeine Empfehlungen für {business_context}-Kontext anwenden",)
+
 
 class FrictionAnalysisEngine:
     """
@@ -14,6 +57,78 @@ class FrictionAnalysisEngine:
     Identifies trait combinations that create entrepreneurial challenges
     """
     
+    # Business impact per friction type - shared by every detected interaction
+    _IMPACT_MAPPINGS = {
+        "delegation_paralysis": {
+            "areas": ("Skalierbarkeit", "Teamproduktivität", "Work-Life-Balance"),
+            "severity_mapping": {
+                "low": "Leichte Verzögerungen bei Teamwachstum",
+                "medium": "Signifikante Skalierungsprobleme",
+                "high": "Kritische Hindernisse für Geschäftswachstum"
+            }
+        },
+        "reckless_decision_making": {
+            "areas": ("Finanzielle Stabilität", "Strategische Planung", "Investorvertrauen"),
+            "severity_mapping": {
+                "low": "Gelegentliche suboptimale Entscheidungen",
+                "medium": "Erhöhtes finanzielles Risiko",
+                "high": "Existenzbedrohende Entscheidungsfehler"
+            }
+        },
+        "innovation_without_market_drive": {
+            "areas": ("Product-Market-Fit", "Kundenakquisition", "Umsatzgenerierung"),
+            "severity_mapping": {
+                "low": "Verlangsamte Markteinführung",
+                "medium": "Schwierigkeiten bei Kundengewinnung",
+                "high": "Produkte ohne Marktrelevanz"
+            }
+        },
+        "opportunity_paralysis": {
+            "areas": ("Marktchancen", "Wettbewerbsposition", "Geschäftswachstum"),
+            "severity_mapping": {
+                "low": "Verpasste kleinere Chancen",
+                "medium": "Signifikant verpasste Marktchancen",
+                "high": "Strategische Wettbewerbsnachteile"
+            }
+        }
+    }
+    _DEFAULT_IMPACT = {
+        "areas": ("Allgemeine Geschäftstätigkeit",),
+        "severity_mapping": {"low": "Geringer Einfluss", "medium": "Moderater Einfluss", "high": "Hoher Einfluss"}
+    }
+    _SEV_BOUNDS = (0.4, 0.7)
+    _SEV_LABELS = ("low", "medium", "high")
+    _BALANCE_BOUNDS = (0.0, 0.5, 1.0)
+    _BALANCE_LABELS = ("optimal", "manageable", "concerning", "critical")
+    
+    # Context-specific mandate notes per friction type
+    _CUSTOMIZATIONS = {
+        "delegation_paralysis": {
+            "restaurant": (
+                "Beginnen Sie mit Küchenaufgaben oder Kundenservice-Routinen",
+                "Nutzen Sie Schichtsysteme für graduelle Verantwortungsübertragung"
+            ),
+            "fintech": (
+                "Starten Sie mit nicht-kritischen Entwicklungsaufgaben",
+                "Implementieren Sie Code-Review-Prozesse für Qualitätskontrolle"
+            ),
+            "consulting": (
+                "Delegieren Sie Research und Datenanalyse-Aufgaben",
+                "Behalten Sie Kundenkontakt und strategische Beratung bei"
+            )
+        },
+        "reckless_decision_making": {
+            "fintech": (
+                "Besondere Vorsicht bei Compliance-relevanten Entscheidungen",
+                "Externe Rechtsberatung für alle regulatorischen Fragen"
+            ),
+            "restaurant": (
+                "Standort- und Mietentscheidungen besonders sorgfältig prüfen",
+                "Lieferantenverträge durch Dritte validieren lassen"
+            )
+        }
+    }
+    
     def __init__(self):
         # Define friction patterns based on psychological research
         self.friction_patterns = {
@@ -248,160 +363,308 @@ class FrictionAnalysisEngine:
             }
         }
         
-        print("🔥 Friction Analysis Engine initialized")
-        print(f"   Loaded {len(self.friction_patterns)} friction patterns")
-        print(f"   Loaded {len(self.intervention_mandates)} intervention mandates")
+        # Pattern and mandate text is interned once and shared by reference with every result
+        self.friction_patterns = _intern_strings(self.friction_patterns)
+        self.intervention_mandates = _intern_strings(self.intervention_mandates)
+        for mandate in self.intervention_mandates.values():
+            # (title, action, duration, success_metric) in phase order
+            mandate["strategy_phases"] = tuple(
+                (phase["title"], phase["action"], phase["duration"], phase["success_metric"])
+                for phase in mandate["strategy"].values()
+            )
+        
+        # Structure-of-arrays view of the patterns for vectorized detection
+        self.build_pattern_arrays()
+        
+        # Pattern hits do not depend on the context, so every context of a profile shares them.
+        # They are pure functions of (patterns, theta) - _version tracks the patterns.
+        self._version = 0
+        self._cached_hits = lru_cache(maxsize=4096)(self._detect_all_patterns)
+        
+        logger.debug("🔥 Friction Analysis Engine initialized: %d friction patterns, %d intervention mandates",
+                     len(self.friction_patterns), len(self.intervention_mandates))
+    
+    def refresh_patterns(self):
+        """Rebuild the derived tables after friction_patterns was changed and drop cached pattern hits"""
+        self.build_pattern_arrays()
+        self._version += 1
+    
+    def build_pattern_arrays(self):
+        """
+        Lay the pattern conditions out as (P, K) arrays, K = most conditions in any pattern
+        
+        Padded slots point at trait 0 with sign 0, so they are always met and add no strength.
+        Unknown operators get an infinite threshold and can never be met.
+        """
+        self._pat_ids = list(self.friction_patterns)
+        self._trait_order = sorted({trait for pattern in self.friction_patterns.values()
+                                    for trait in pattern["conditions"]})
+        self.trait_index = {trait: i for i, trait in enumerate(self._trait_order)}
+        
+        n_patterns = len(self._pat_ids)
+        k = max((len(pattern["conditions"]) for pattern in self.friction_patterns.values()), default=0)
+        self._pat_trait_idx = np.zeros((n_patterns, k), dtype=np.int32)
+        self._pat_thresh = np.zeros((n_patterns, k))
+        self._pat_sign = np.zeros((n_patterns, k), dtype=np.int8)
+        self._pat_n_traits = np.array([len(pattern["traits"]) for pattern in self.friction_patterns.values()],
+                                      dtype=np.float64)
+        self._pat_severity_multiplier = np.array([pattern["severity_multiplier"]
+                                                  for pattern in self.friction_patterns.values()], dtype=np.float64)
+        
+        for row, pattern in enumerate(self.friction_patterns.values()):
+            for col, (trait, condition) in enumerate(pattern["conditions"].items()):
+                self._pat_trait_idx[row, col] = self.trait_index[trait]
+                if condition["operator"] in (">=", "<="):
+                    self._pat_sign[row, col] = 1 if condition["operator"] == ">=" else -1
+                    self._pat_thresh[row, col] = condition["threshold"]
+                else:
+                    self._pat_sign[row, col] = 1
+                    self._pat_thresh[row, col] = np.inf
+        
+        # Applicable pattern rows per business context - unknown contexts are resolved on demand
+        all_contexts = {context for pattern in self.friction_patterns.values()
+                        for context in pattern["business_contexts"]}
+        all_contexts |= {"general", "fintech", "ecommerce", "restaurant", "consulting"}
+        all_contexts.discard("all")
+        self._ctx_rows = {context: self._applicable_rows(context) for context in all_contexts}
+        self._ctx_suffix = {context: f"Besonders relevant für {context}-Geschäfte" for context in all_contexts}
+        self._default_customizations = {context: _default_customization(context) for context in all_contexts}
+        
+        # (C, P) applicability mask for batch scoring, contexts addressed by index
+        self.context_names = tuple(sorted(all_contexts))
+        self.context_index = {context: i for i, context in enumerate(self.context_names)}
+        self._ctx_mask = np.zeros((len(self.context_names), n_patterns), dtype=np.bool_)
+        for context, rows in self._ctx_rows.items():
+            self._ctx_mask[self.context_index[context], rows] = True
+        
+        # Conditions as margins theta * sign - signed threshold, >= 0 when met
+        self._pat_signed_thresh = self._pat_sign * self._pat_thresh
+        
+        # Same mask as a (C, P) weight matrix - net friction for every context is one mat-vec
+        self._ctx_weights = self._ctx_mask.astype(np.float64)
+        self._pat_base_severity = np.abs(self._pat_severity_multiplier)
+        self._pat_net_sign = np.where(self._pat_severity_multiplier < 0, -1.0, 1.0)
+        self._pat_is_synergy = (self._pat_severity_multiplier < 0).tolist()
+        
+        # Per-thread theta buffer reused by score_profiles for score dicts
+        self._local = threading.local()
+        
+        self._context_rows = lru_cache(maxsize=64)(self._applicable_rows)
+        
+        # Pattern hits are computed over every pattern and filtered per context by row membership
+        self._ctx_row_sets = {context: frozenset(rows.tolist()) for context, rows in self._ctx_rows.items()}
+    
+    def _applicable_rows(self, business_context: str) -> np.ndarray:
+        """Row indices of the patterns that apply to a business context"""
+        return np.array([row for row, pattern in enumerate(self.friction_patterns.values())
+                         if "all" in pattern["business_contexts"]
+                         or business_context in pattern["business_contexts"]], dtype=np.int32)
     
-    def detect_trait_interactions(self, theta_scores: Dict[str, float], 
-                                business_context: str = "general") -> List[Dict]:
+    def detect_trait_interactions(self, theta_scores: Dict[str, float], business_context: str = "general",
+                                  split: bool = False) -> Union[List[Dict], Tuple[List[Dict], List[Dict]]]:
         """
         Detect trait interactions and friction patterns
         
         Args:
             theta_scores: Dict of trait -> theta value
             business_context: Business context for relevance filtering
+            split: Return (frictions, synergies) instead of one list
+        
+        Returns:
+            List of detected interactions with severity and recommendations, highest severity first
+        """
+        # Hits over every pattern, cached per profile, filtered to this business context
+        applicable = self._applicable_row_set(business_context)
+        hits = [hit for hit in self._cached_hits(self._version, tuple(sorted(theta_scores.items())))
+                if hit[0] in applicable]
+        
+        return self._apply_context(hits, theta_scores, business_context, split)
+    
+    def net_friction_by_context(self, theta_scores: Dict[str, float]) -> np.ndarray:
+        """
+        Net friction (friction minus synergy severity) of a profile in every known context
+        
+        Args:
+            theta_scores: Dict of trait -> theta value
+        
+        Returns:
+            Array aligned with self.context_names
+        """
+        detected, strength = self._match_patterns(self._theta_vector(theta_scores))
+        severity = np.minimum(1.0, self._pat_base_severity * (1 + strength))
+        return self._ctx_weights @ np.where(detected, self._pat_net_sign * severity, 0.0)
+    
+    def _theta_vector(self, theta_scores: Dict[str, float]) -> np.ndarray:
+        """Theta scores as a (T,) vector ordered as self.trait_index"""
+        return np.fromiter([theta_scores.get(trait, 0.0) for trait in self._trait_order],
+                           dtype=np.float64, count=len(self._trait_order))
+    
+    def _match_patterns(self, theta: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Evaluate every pattern against a (T,) theta vector or (N, T) theta rows
         
         Returns:
-            List of detected interactions with severity and recommendations
+            (..., P) detection mask and strength factor - summed condition margins per trait,
+            only meaningful where detected
         """
+        margins = theta[..., self._pat_trait_idx] * self._pat_sign  # (..., P, K)
+        margins -= self._pat_signed_thresh
+        detected = np.minimum.reduce(margins, axis=-1) >= 0
+        strength = np.add.reduce(margins, axis=-1) / self._pat_n_traits
+        return detected, strength
+    
+    def _detect_all_patterns(self, version: int, theta_items: Tuple[Tuple[str, float], ...]) -> Tuple:
+        """(row, strength_factor) for every detected pattern, regardless of context - version tracks the patterns"""
+        detected, strength = self._match_patterns(self._theta_vector(dict(theta_items)))
+        return tuple((row, strength_factor)
+                     for row, (hit, strength_factor) in enumerate(zip(detected.tolist(), strength.tolist())) if hit)
+    
+    def _applicable_row_set(self, business_context: str) -> frozenset:
+        """Pattern rows that apply to a business context, as a set"""
+        rows = self._ctx_row_sets.get(business_context)
+        if rows is None:
+            rows = frozenset(self._context_rows(business_context).tolist())
+        return rows
+    
+    def _apply_context(self, hits, theta_scores: Dict[str, float], business_context: str,
+                       split: bool) -> Union[List[Dict], Tuple[List[Dict], List[Dict]]]:
+        """Interaction reports for the (row, strength_factor) hits of one business context"""
         detected_interactions = []
         
-        for pattern_id, pattern in self.friction_patterns.items():
-            # Check if pattern applies to this business context
-            if "all" not in pattern["business_contexts"] and business_context not in pattern["business_contexts"]:
-                continue
-            
-            # Check if threshold conditions are met
-            pattern_detected = True
-            interaction_strength = 0.0
-            condition_details = {}
-            
-            for trait, condition in pattern["conditions"].items():
-                trait_score = theta_scores.get(trait, 0.0)
-                threshold = condition["threshold"]
-                operator = condition["operator"]
-                
-                # Evaluate condition
-                if operator == ">=":
-                    condition_met = trait_score >= threshold
-                    if condition_met:
-                        interaction_strength += (trait_score - threshold)
-                elif operator == "<=":
-                    condition_met = trait_score <= threshold
-                    if condition_met:
-                        interaction_strength += abs(trait_score - threshold)
-                else:
-                    condition_met = False
-                
-                condition_details[trait] = {
-                    "score": trait_score,
-                    "threshold": threshold,
-                    "operator": operator,
-                    "met": condition_met
-                }
-                
-                if not condition_met:
-                    pattern_detected = False
-                    break
-            
-            if pattern_detected:
-                # Calculate friction severity
-                base_severity = abs(pattern["severity_multiplier"])
-                strength_factor = interaction_strength / len(pattern["traits"])
-                final_severity = min(1.0, base_severity * (1 + strength_factor))
-                
-                interaction = {
-                    "pattern_id": pattern_id,
-                    "friction_type": pattern["friction_type"],
-                    "interaction_type": "synergy" if pattern["severity_multiplier"] < 0 else "friction",
-                    "severity": final_severity,
-                    "strength": strength_factor,
-                    "description_de": pattern["description_de"],
-                    "description_en": pattern["description_en"],
-                    "manifestation": pattern["manifestation"],
-                    "affected_traits": pattern["traits"],
-                    "condition_details": condition_details,
-                    "business_impact": self.assess_business_impact(pattern["friction_type"], final_severity, business_context),
-                    "research_basis": pattern["research_basis"]
-                }
-                
-                detected_interactions.append(interaction)
+        for row, strength_factor in hits:
+            pattern_id = self._pat_ids[row]
+            scores = tuple(theta_scores.get(trait, 0.0) for trait in self.friction_patterns[pattern_id]["conditions"])
+            detected_interactions.append(
+                self._make_interaction(pattern_id, strength_factor, scores, business_context)
+            )
+        
+        if split:
+            # Partition by the sign of each detected pattern's severity multiplier
+            synergy_mask = [self._pat_is_synergy[row] for row, _ in hits]
+            frictions = list(compress(detected_interactions, [not synergy for synergy in synergy_mask]))
+            synergies = list(compress(detected_interactions, synergy_mask))
+            frictions.sort(key=itemgetter("severity"), reverse=True)
+            synergies.sort(key=itemgetter("severity"), reverse=True)
+            return frictions, synergies
         
         # Sort by severity (highest first)
-        detected_interactions.sort(key=lambda x: x["severity"], reverse=True)
+        detected_interactions.sort(key=itemgetter("severity"), reverse=True)
         
         return detected_interactions
     
-    def assess_business_impact(self, friction_type: str, severity: float, business_context: str) -> Dict:
-        """Assess the business impact of detected friction"""
-        impact_mappings = {
-            "delegation_paralysis": {
-                "areas": ["Skalierbarkeit", "Teamproduktivität", "Work-Life-Balance"],
-                "severity_mapping": {
-                    "low": "Leichte Verzögerungen bei Teamwachstum",
-                    "medium": "Signifikante Skalierungsprobleme",
-                    "high": "Kritische Hindernisse für Geschäftswachstum"
-                }
-            },
-            "reckless_decision_making": {
-                "areas": ["Finanzielle Stabilität", "Strategische Planung", "Investorvertrauen"],
-                "severity_mapping": {
-                    "low": "Gelegentliche suboptimale Entscheidungen",
-                    "medium": "Erhöhtes finanzielles Risiko",
-                    "high": "Existenzbedrohende Entscheidungsfehler"
-                }
-            },
-            "innovation_without_market_drive": {
-                "areas": ["Product-Market-Fit", "Kundenakquisition", "Umsatzgenerierung"],
-                "severity_mapping": {
-                    "low": "Verlangsamte Markteinführung",
-                    "medium": "Schwierigkeiten bei Kundengewinnung",
-                    "high": "Produkte ohne Marktrelevanz"
+    def score_profiles(self, theta_matrix: Union[np.ndarray, List[Dict[str, float]]],
+                       ctx_ids: np.ndarray) -> List[List[Dict]]:
+        """
+        detect_trait_interactions for a whole cohort in one vectorized pass
+        
+        Args:
+            theta_matrix: (N, T) theta values, columns ordered as self.trait_index, or a list of score dicts
+            ctx_ids: (N,) business context of each profile as an index into self.context_names
+        
+        Returns:
+            One severity-sorted interaction list per profile
+        """
+        if isinstance(theta_matrix, np.ndarray):
+            theta = np.ascontiguousarray(theta_matrix, dtype=np.float64).reshape(-1, len(self._trait_order))
+        else:
+            theta = self._fill_theta_buffer(theta_matrix)
+        ctx_ids = np.ascontiguousarray(ctx_ids, dtype=np.int64)
+        detected, strength = self._match_patterns(theta)
+        detected &= self._ctx_mask[ctx_ids]
+        
+        results = [[] for _ in range(len(theta))]
+        # Python objects only for the detected (profile, pattern) cells
+        for n, row in zip(*np.nonzero(detected)):
+            pattern_id = self._pat_ids[row]
+            scores = tuple(float(theta[n, self.trait_index[trait]])
+                           for trait in self.friction_patterns[pattern_id]["conditions"])
+            results[n].append(self._make_interaction(pattern_id, float(strength[n, row]), scores,
+                                                     self.context_names[ctx_ids[n]]))
+        
+        for interactions in results:
+            interactions.sort(key=itemgetter("severity"), reverse=True)
+        
+        return results
+    
+    def _fill_theta_buffer(self, profiles: List[Dict[str, float]]) -> np.ndarray:
+        """Copy score dicts into this thread's reusable theta buffer - valid until its next call"""
+        n = len(profiles)
+        buf = getattr(self._local, "theta_buf", None)
+        if buf is None or buf.shape[0] < n:
+            buf = self._local.theta_buf = np.empty((max(n, 64), len(self._trait_order)))
+        
+        theta = buf[:n]
+        for row, scores in zip(theta, profiles):
+            for i, trait in enumerate(self._trait_order):
+                row[i] = scores.get(trait, 0.0)
+        return theta
+    
+    def _make_interaction(self, pattern_id: str, strength_factor: float, scores: Tuple[float, ...],
+                          business_context: str) -> Dict:
+        """Interaction report for a detected pattern, scores aligned with its conditions"""
+        pattern = self.friction_patterns[pattern_id]
+        
+        # Calculate friction severity
+        base_severity = abs(pattern["severity_multiplier"])
+        final_severity = min(1.0, base_severity * (1 + strength_factor))
+        
+        return {
+            "pattern_id": pattern_id,
+            "friction_type": pattern["friction_type"],
+            "interaction_type": "synergy" if pattern["severity_multiplier"] < 0 else "friction",
+            "severity": final_severity,
+            "strength": strength_factor,
+            "description_de": pattern["description_de"],
+            "description_en": pattern["description_en"],
+            "manifestation": pattern["manifestation"],
+            "affected_traits": pattern["traits"],
+            # Every condition is met by construction
+            "condition_details": {
+                trait: {
+                    "score": score,
+                    "threshold": condition["threshold"],
+                    "operator": condition["operator"],
+                    "met": True
                 }
+                for score, (trait, condition) in zip(scores, pattern["conditions"].items())
             },
-            "opportunity_paralysis": {
-                "areas": ["Marktchancen", "Wettbewerbsposition", "Geschäftswachstum"],
-                "severity_mapping": {
-                    "low": "Verpasste kleinere Chancen",
-                    "medium": "Signifikant verpasste Marktchancen",
-                    "high": "Strategische Wettbewerbsnachteile"
-                }
-            }
+            "business_impact": self.assess_business_impact(pattern["friction_type"], final_severity, business_context),
+            "research_basis": pattern["research_basis"]
         }
+    
+    def assess_business_impact(self, friction_type: str, severity: float, business_context: str) -> Dict:
+        """Assess the business impact of detected friction"""
+        friction_impact = self._IMPACT_MAPPINGS.get(friction_type, self._DEFAULT_IMPACT)
         
-        friction_impact = impact_mappings.get(friction_type, {
-            "areas": ["Allgemeine Geschäftstätigkeit"],
-            "severity_mapping": {"low": "Geringer Einfluss", "medium": "Moderater Einfluss", "high": "Hoher Einfluss"}
-        })
+        # Determine severity level (< 0.4 low, < 0.7 medium, else high)
+        severity_level = self._SEV_LABELS[bisect_right(self._SEV_BOUNDS, severity)]
         
-        # Determine severity level
-        if severity >= 0.7:
-            severity_level = "high"
-        elif severity >= 0.4:
-            severity_level = "medium"
-        else:
-            severity_level = "low"
+        context_note = self._ctx_suffix.get(business_context)
+        if context_note is None:
+            context_note = f"Besonders relevant für {business_context}-Geschäfte"
         
         return {
-            "affected_areas": friction_impact["areas"],
+            "affected_areas": list(friction_impact["areas"]),
             "severity_level": severity_level,
             "description": friction_impact["severity_mapping"][severity_level],
-            "business_context_specific": f"Besonders relevant für {business_context}-Geschäfte"
+            "business_context_specific": context_note
         }
     
     def generate_friction_mandates(self, detected_interactions: List[Dict], 
-                                 business_context: str) -> List[Dict]:
+                                 business_context: str, top_k: Optional[int] = None) -> List[Dict]:
         """
         Generate specific intervention mandates for detected friction
         
         Args:
             detected_interactions: List of detected friction patterns
             business_context: Business context for customization
+            top_k: Only return the top_k most urgent mandates
         
         Returns:
             List of actionable mandates with implementation details
         """
         mandates = []
+        today = self._today_str()
         
         for interaction in detected_interactions:
             if interaction["interaction_type"] == "synergy":
@@ -423,7 +686,7 @@ class FrictionAnalysisEngine:
                     timeline = "1-2 Wochen"  # Faster implementation for fintech risk issues
                 
                 mandate = {
-                    "mandate_id": f"{friction_type}_{business_context}_{datetime.now().strftime('%Y%m%d')}",
+                    "mandate_id": f"{friction_type}_{business_context}_{today}",
                     "title_de": mandate_template["mandate_title_de"],
                     "title_en": mandate_template["mandate_title_en"],
                     "friction_pattern": interaction["pattern_id"],
@@ -431,7 +694,11 @@ class FrictionAnalysisEngine:
                     "urgency_level": adjusted_urgency,
                     "friction_severity": severity,
                     "implementation_timeline": timeline,
-                    "strategy": mandate_template["strategy"],
+                    # Template text is shared by reference; strategy gets its own plain dicts
+                    "strategy": {
+                        phase: dict(details) for phase, details in mandate_template["strategy"].items()
+                    },
+                    "strategy_phases": mandate_template["strategy_phases"],
                     "calendar_integration": mandate_template["calendar_integration"],
                     "tools_needed": mandate_template["tools_needed"],
                     "success_indicators": mandate_template["success_indicators"],
@@ -444,42 +711,24 @@ class FrictionAnalysisEngine:
                 mandates.append(mandate)
         
         # Sort by urgency level (highest first)
-        mandates.sort(key=lambda x: x["urgency_level"], reverse=True)
+        if top_k is not None:
+            return heapq.nlargest(top_k, mandates, key=itemgetter("urgency_level"))
+        mandates.sort(key=itemgetter("urgency_level"), reverse=True)
         
         return mandates
     
+    def _today_str(self) -> str:
+        """Today's local date as YYYYMMDD"""
+        return _date_prefix(date.today().toordinal())
+    
     def customize_for_context(self, friction_type: str, business_context: str) -> List[str]:
         """Provide context-specific customization notes"""
-        customizations = {
-            "delegation_paralysis": {
-                "restaurant": [
-                    "Beginnen Sie mit Küchenaufgaben oder Kundenservice-Routinen",
-                    "Nutzen Sie Schichtsysteme für graduelle Verantwortungsübertragung"
-                ],
-                "fintech": [
-                    "Starten Sie mit nicht-kritischen Entwicklungsaufgaben",
-                    "Implementieren Sie Code-Review-Prozesse für Qualitätskontrolle"
-                ],
-                "consulting": [
-                    "Delegieren Sie Research und Datenanalyse-Aufgaben",
-                    "Behalten Sie Kundenkontakt und strategische Beratung bei"
-                ]
-            },
-            "reckless_decision_making": {
-                "fintech": [
-                    "Besondere Vorsicht bei Compliance-relevanten Entscheidungen",
-                    "Externe Rechtsberatung für alle regulatorischen Fragen"
-                ],
-                "restaurant": [
-                    "Standort- und Mietentscheidungen besonders sorgfältig prüfen",
-                    "Lieferantenverträge durch Dritte validieren lassen"
-                ]
-            }
-        }
-        
-        return customizations.get(friction_type, {}).get(business_context, [
-            f"Allgemeine Empfehlungen für {business_context}-Kontext anwenden"
-        ])
+        notes = self._CUSTOMIZATIONS.get(friction_type, {}).get(business_context)
+        if notes is None:
+            notes = self._default_customizations.get(business_context)
+            if notes is None:
+                notes = _default_customization(business_context)
+        return list(notes)
     
     def generate_comprehensive_friction_analysis(self, theta_scores: Dict[str, float], 
                                                business_context: str) -> Dict:
@@ -493,13 +742,16 @@ class FrictionAnalysisEngine:
         Returns:
             Complete friction analysis with actionable recommendations
         """
-        # Detect interactions
-        interactions = self.detect_trait_interactions(theta_scores, business_context)
+        # Detect interactions (shared across contexts), already split into frictions and synergies
+        applicable = self._applicable_row_set(business_context)
+        hits = [hit for hit in self._cached_hits(self._version, tuple(sorted(theta_scores.items())))
+                if hit[0] in applicable]
+        friction_interactions, synergy_interactions = self._apply_context(
+            hits, theta_scores, business_context, split=True
+        )
+        total_interactions = len(friction_interactions) + len(synergy_interactions)
         
         # Generate mandates for friction patterns
-        friction_interactions = [i for i in interactions if i["interaction_type"] == "friction"]
-        synergy_interactions = [i for i in interactions if i["interaction_type"] == "synergy"]
-        
         mandates = self.generate_friction_mandates(friction_interactions, business_context)
         
         # Calculate overall friction score
@@ -508,14 +760,8 @@ class FrictionAnalysisEngine:
         
         friction_balance = total_friction - total_synergy
         
-        if friction_balance <= 0:
-            friction_level = "optimal"
-        elif friction_balance <= 0.5:
-            friction_level = "manageable"
-        elif friction_balance <= 1.0:
-            friction_level = "concerning"
-        else:
-            friction_level = "critical"
+        # <= 0 optimal, <= 0.5 manageable, <= 1.0 concerning, else critical
+        friction_level = self._BALANCE_LABELS[bisect_left(self._BALANCE_BOUNDS, friction_balance)]
         
         return {
             "business_context": business_context,
@@ -524,7 +770,7 @@ class FrictionAnalysisEngine:
                 "synergy_score": total_synergy,
                 "net_friction": friction_balance,
                 "friction_level": friction_level,
-                "total_interactions": len(interactions)
+                "total_interactions": total_interactions
             },
             "detected_frictions": friction_interactions,
             "detected_synergies": synergy_interactions,
@@ -575,9 +821,65 @@ class FrictionAnalysisEngine:
         
         return recommendations
 
+# Report templates, parsed once and filled from the analysis dicts with format_map
+_OVERALL_TMPL = (
+    "   Friction Level: {friction_level}\n"
+    "   Net Friction: {net_friction:.2f}"
+)
+_FRICTION_TMPL = (
+    "   • {pattern_id}: {severity:.2f} severity\n"
+    "     {description_de}\n"
+    "     Impact: {business_impact[description]}"
+)
+_SYNERGY_TMPL = (
+    "   • {pattern_id}: {severity:.2f} strength\n"
+    "     {description_de}"
+)
+_MANDATE_TMPL = (
+    "   • {title_de} (Urgency: {urgency_level}/5)\n"
+    "     Timeline: {implementation_timeline}\n"
+    "     Key Success: {success_indicators[0]}"
+)
+
+# One scratch buffer per thread, reused by every render_friction_report call
+_REPORT_BUF = threading.local()
+
+
+def render_friction_report(analysis: Dict, title: str) -> str:
+    """Human-readable section for one generate_comprehensive_friction_analysis result"""
+    buf = getattr(_REPORT_BUF, "buf", None)
+    if buf is None:
+        buf = _REPORT_BUF.buf = io.StringIO()
+    buf.seek(0)
+    buf.truncate()
+    write = buf.write
+    
+    overall = analysis["overall_friction_analysis"]
+    write(f"\n🔥 Friction Analysis for {title} Business:\n")
+    write(_OVERALL_TMPL.format_map({**overall, "friction_level": overall["friction_level"].upper()}))
+    write(f"\n   Total Interactions: {overall['total_interactions']}\n")
+    
+    write("\n🚨 Detected Frictions:")
+    for friction in analysis["detected_frictions"]:
+        write("\n")
+        write(_FRICTION_TMPL.format_map(friction))
+    
+    write("\n\n✅ Detected Synergies:")
+    for synergy in analysis["detected_synergies"]:
+        write("\n")
+        write(_SYNERGY_TMPL.format_map(synergy))
+    
+    write("\n\n🎯 Intervention Mandates:")
+    for mandate in analysis["intervention_mandates"]:
+        write("\n")
+        write(_MANDATE_TMPL.format_map(mandate))
+    
+    return buf.getvalue()
+
 # Test the friction analysis engine
 if __name__ == "__main__":
-    print("🔥 Testing Friction Analysis Engine...")
+    # --verbose shows the engine's own DEBUG logging, --pretty the human-readable report instead of JSON
+    logging.basicConfig(level=logging.DEBUG if "--verbose" in sys.argv else logging.INFO, format="%(message)s")
     
     # Initialize engine
     friction_engine = FrictionAnalysisEngine()
@@ -593,80 +895,84 @@ if __name__ == "__main__":
         "competitive_aggressiveness": -0.3  # Low competitiveness
     }
     
-    print("\n👤 Testing Problematic Personality Profile:")
-    for trait, score in problematic_profile.items():
-        print(f"   {trait:25}: {score:+.1f}")
-    
-    # Analyze friction for fintech context
-    print(f"\n🔥 Friction Analysis for Fintech Business:")
+    # Analyze friction for fintech and restaurant context
     fintech_analysis = friction_engine.generate_comprehensive_friction_analysis(
         problematic_profile, "fintech"
     )
-    
-    overall = fintech_analysis["overall_friction_analysis"]
-    print(f"   Friction Level: {overall['friction_level'].upper()}")
-    print(f"   Net Friction: {overall['net_friction']:.2f}")
-    print(f"   Total Interactions: {overall['total_interactions']}")
-    
-    print(f"\n🚨 Detected Frictions:")
-    for friction in fintech_analysis["detected_frictions"]:
-        print(f"   • {friction['pattern_id']}: {friction['severity']:.2f} severity")
-        print(f"     {friction['description_de']}")
-        print(f"     Impact: {friction['business_impact']['description']}")
-    
-    print(f"\n✅ Detected Synergies:")
-    for synergy in fintech_analysis["detected_synergies"]:
-        print(f"   • {synergy['pattern_id']}: {synergy['severity']:.2f} strength")
-        print(f"     {synergy['description_de']}")
-    
-    print(f"\n🎯 Intervention Mandates:")
-    for mandate in fintech_analysis["intervention_mandates"]:
-        print(f"   • {mandate['title_de']} (Urgency: {mandate['urgency_level']}/5)")
-        print(f"     Timeline: {mandate['implementation_timeline']}")
-        print(f"     Key Success: {mandate['success_indicators'][0]}")
-    
-    # Test different context
-    print(f"\n🔥 Friction Analysis for Restaurant Business:")
     restaurant_analysis = friction_engine.generate_comprehensive_friction_analysis(
         problematic_profile, "restaurant"
     )
-    
+    overall = fintech_analysis["overall_friction_analysis"]
     restaurant_overall = restaurant_analysis["overall_friction_analysis"]
-    print(f"   Friction Level: {restaurant_overall['friction_level'].upper()}")
-    print(f"   Net Friction: {restaurant_overall['net_friction']:.2f}")
+    recs = fintech_analysis["strategic_recommendations"]
     
-    # Compare contexts
-    fintech_friction = overall['net_friction']
-    restaurant_friction = restaurant_overall['net_friction']
+    # Compare contexts - net friction for every known context in one pass
+    net_friction = friction_engine.net_friction_by_context(problematic_profile)
+    fintech_friction = float(net_friction[friction_engine.context_index["fintech"]])
+    restaurant_friction = float(net_friction[friction_engine.context_index["restaurant"]])
     
-    print(f"\n📊 Context Comparison:")
-    print(f"   Fintech Friction:    {fintech_friction:.2f}")
-    print(f"   Restaurant Friction: {restaurant_friction:.2f}")
+    # Lowest net friction wins, first listed on a tie
+    context_frictions = [("Fintech", fintech_friction), ("Restaurant", restaurant_friction)]
+    winner, winner_friction = min(context_frictions, key=itemgetter(1))
+    difference = max(friction for _, friction in context_frictions) - winner_friction
     
-    if restaurant_friction < fintech_friction:
-        difference = fintech_friction - restaurant_friction
-        print(f"   🎯 RECOMMENDATION: Restaurant (-{difference:.2f} less friction)")
-    else:
-        difference = restaurant_friction - fintech_friction
-        print(f"   🎯 RECOMMENDATION: Fintech (-{difference:.2f} less friction)")
+    if "--pretty" not in sys.argv:
+        report = {
+            "overall": overall,
+            "frictions": fintech_analysis["detected_frictions"],
+            "synergies": fintech_analysis["detected_synergies"],
+            "mandates": fintech_analysis["intervention_mandates"],
+            "recs": recs,
+            "compare": {"fintech": fintech_friction, "restaurant": restaurant_friction,
+                        "recommended": winner.lower(), "difference": difference}
+        }
+        if orjson is not None:
+            sys.stdout.buffer.write(orjson.dumps(report, option=orjson.OPT_APPEND_NEWLINE))
+        else:
+            sys.stdout.write(json.dumps(report, ensure_ascii=False) + "\n")
+        sys.stdout.flush()
+        sys.exit(0)
     
-    print(f"\n🎯 Strategic Recommendations:")
-    recs = fintech_analysis["strategic_recommendations"]
+    # The report is collected and written to stdout once at the end
+    report_lines = []
+    emit = report_lines.append
+    
+    emit("🔥 Testing Friction Analysis Engine...")
+    
+    emit("\n👤 Testing Problematic Personality Profile:")
+    for trait, score in problematic_profile.items():
+        emit(f"   {trait:25}: {score:+.1f}")
+    
+    emit(render_friction_report(fintech_analysis, "Fintech"))
+    
+    # Test different context
+    emit(f"\n🔥 Friction Analysis for Restaurant Business:")
+    emit(_OVERALL_TMPL.format_map({**restaurant_overall,
+                                   "friction_level": restaurant_overall["friction_level"].upper()}))
+    
+    emit(f"\n📊 Context Comparison:")
+    emit(f"   Fintech Friction:    {fintech_friction:.2f}")
+    emit(f"   Restaurant Friction: {restaurant_friction:.2f}")
+    emit(f"   🎯 RECOMMENDATION: {winner} (-{difference:.2f} less friction)")
+    
+    emit(f"\n🎯 Strategic Recommendations:")
     
     if recs["immediate_priorities"]:
-        print(f"   IMMEDIATE:")
-        for rec in recs["immediate_priorities"][:2]:
-            print(f"     • {rec['action']}")
+        emit(f"   IMMEDIATE:")
+        emit("\n".join([f"     • {rec['action']}" for rec in islice(recs["immediate_priorities"], 2)]))
     
     if recs["preserve_strengths"]:
-        print(f"   PRESERVE:")
-        for strength in recs["preserve_strengths"]:
-            print(f"     • {strength['strength']}")
-    
-    print("\n🎉 FRICTION ANALYSIS ENGINE TEST SUCCESSFUL!")
-    print("✅ Trait interaction detection working")
-    print("✅ Friction severity calculation functional")
-    print("✅ Context-specific intervention mandates generated")
-    print("✅ Strategic recommendations provided")
-    print("✅ Business context comparison completed")
-    print("\n🚀 Ready for Phase 3 Integration!")
\ No newline at end of file
+        emit(f"   PRESERVE:")
+        emit("\n".join([f"     • {strength['strength']}" for strength in recs["preserve_strengths"]]))
+    
+    emit("\n🎉 FRICTION ANALYSIS ENGINE TEST SUCCESSFUL!")
+    emit("✅ Trait interaction detection working")
+    emit("✅ Friction severity calculation functional")
+    emit("✅ Context-specific intervention mandates generated")
+    emit("✅ Strategic recommendations provided")
+    emit("✅ Business context comparison completed")
+    emit("\n🚀 Ready for Phase 3 Integration!")
+    
+    sys.stdout.write("\n".join(report_lines))
+    sys.stdout.write("\n")
+    sys.stdout.flush()
@@ -11,13 +11,221 @@ Integrates:
 """
 
 import json
+import logging
 import math
 import random
+import time
 import uuid
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Tuple, Optional, Any, Union
 import statistics
 
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Reference tables shared by every IntegratedGruenderAI instance - treat as read-only
+
+# Simplified IRT item bank for demo
+_ITEM_BANK = (
+    {
+        "item_id": "risk_001",
+        "dimension": "risk_taking",
+        "text_de": "Ich bin bereit, finanzielle Risiken einzugehen, um mein Geschäft voranzubringen",
+        "discrimination": 1.2,
+        "difficulty": 0.5,
+        "business_context": "general",
+        "interaction_target": "risk_achievement_friction"
+    },
+    {
+        "item_id": "autonomy_001", 
+        "dimension": "autonomy_orientation",
+        "text_de": "Ich arbeite am besten, wenn ich völlige Kontrolle über meine Aufgaben habe",
+        "discrimination": 1.4,
+        "difficulty": 0.0,
+        "business_context": "general",
+        "interaction_target": "autonomy_self_efficacy_friction"
+    },
+    {
+        "item_id": "efficacy_001",
+        "dimension": "self_efficacy", 
+        "text_de": "Ich bin zuversichtlich, auch schwierige Geschäftsprobleme lösen zu können",
+        "discrimination": 1.3,
+        "difficulty": -0.2,
+        "business_context": "general",
+        "interaction_target": "autonomy_self_efficacy_friction"
+    },
+    {
+        "item_id": "innovation_001",
+        "dimension": "innovativeness",
+        "text_de": "Ich entwickle gerne völlig neue Lösungsansätze für bestehende Probleme",
+        "discrimination": 1.1,
+        "difficulty": 0.3,
+        "business_context": "fintech",
+        "interaction_target": "innovation_autonomy_synergy"
+    },
+    {
+        "item_id": "achievement_001",
+        "dimension": "achievement_orientation",
+        "text_de": "Ich setze mir sehr hohe Leistungsstandards und arbeite hart, um sie zu erreichen",
+        "discrimination": 1.0,
+        "difficulty": 0.1,
+        "business_context": "general",
+        "interaction_target": "risk_achievement_friction"
+    },
+    {
+        "item_id": "proactive_001",
+        "dimension": "proactiveness",
+        "text_de": "Ich erkenne Geschäftschancen, bevor andere sie sehen",
+        "discrimination": 1.3,
+        "difficulty": 0.7,
+        "business_context": "ecommerce",
+        "interaction_target": "proactiveness_efficacy_friction"
+    },
+    {
+        "item_id": "competitive_001",
+        "dimension": "competitive_aggressiveness",
+        "text_de": "Ich bin entschlossen, meine Konkurrenten zu übertreffen",
+        "discrimination": 1.2,
+        "difficulty": 0.4,
+        "business_context": "general",
+        "interaction_target": "innovation_competition_friction"
+    }
+)
+
+_DIMENSIONS = (
+    "risk_taking", "innovativeness", "self_efficacy", 
+    "achievement_orientation", "proactiveness", 
+    "autonomy_orientation", "competitive_aggressiveness"
+)
+
+_TRAIT_WEIGHTS = {
+    "fintech": {
+        "risk_taking": 0.85, "innovativeness": 0.80, "self_efficacy": 0.75,
+        "achievement_orientation": 0.70, "proactiveness": 0.65,
+        "autonomy_orientation": 0.45, "competitive_aggressiveness": 0.55
+    },
+    "consulting": {
+        "risk_taking": 0.35, "innovativeness": 0.50, "self_efficacy": 0.80,
+        "achievement_orientation": 0.75, "proactiveness": 0.70,
+        "autonomy_orientation": 0.85, "competitive_aggressiveness": 0.60
+    },
+    "restaurant": {
+        "risk_taking": 0.60, "innovativeness": 0.45, "self_efficacy": 0.70,
+        "achievement_orientation": 0.65, "proactiveness": 0.55,
+        "autonomy_orientation": 0.75, "competitive_aggressiveness": 0.50
+    },
+    "ecommerce": {
+        "risk_taking": 0.70, "innovativeness": 0.75, "self_efficacy": 0.65,
+        "achievement_orientation": 0.80, "proactiveness": 0.85,
+        "autonomy_orientation": 0.60, "competitive_aggressiveness": 0.75
+    }
+}
+
+_BUSINESS_CONTEXTS = {
+    "fintech": {
+        "regulatory_complexity": 5, "capital_requirements": 250000,
+        "gruendungszuschuss_compatibility": 0.6, "approval_probability_base": 0.55
+    },
+    "consulting": {
+        "regulatory_complexity": 2, "capital_requirements": 15000,
+        "gruendungszuschuss_compatibility": 0.9, "approval_probability_base": 0.75
+    },
+    "restaurant": {
+        "regulatory_complexity": 3, "capital_requirements": 120000,
+        "gruendungszuschuss_compatibility": 0.8, "approval_probability_base": 0.65
+    },
+    "ecommerce": {
+        "regulatory_complexity": 3, "capital_requirements": 50000,
+        "gruendungszuschuss_compatibility": 0.7, "approval_probability_base": 0.60
+    }
+}
+
+_FRICTION_PATTERNS = {
+    "autonomy_self_efficacy_friction": {
+        "traits": ["autonomy_orientation", "self_efficacy"],
+        "conditions": {"autonomy_orientation": {"operator": ">=", "threshold": 0.6},
+                     "self_efficacy": {"operator": "<=", "threshold": -0.5}},
+        "severity_multiplier": 0.8,
+        "description": "Hohe Autonomie mit geringer Selbstwirksamkeit führt zu Delegationsproblemen"
+    },
+    "risk_achievement_friction": {
+        "traits": ["risk_taking", "achievement_orientation"],
+        "conditions": {"risk_taking": {"operator": ">=", "threshold": 0.5},
+                     "achievement_orientation": {"operator": "<=", "threshold": -0.3}},
+        "severity_multiplier": 0.7,
+        "description": "Hohe Risikobereitschaft ohne Leistungsorientierung führt zu unvorsichtigen Entscheidungen"
+    },
+    "innovation_autonomy_synergy": {
+        "traits": ["innovativeness", "autonomy_orientation"],
+        "conditions": {"innovativeness": {"operator": ">=", "threshold": 0.4},
+                     "autonomy_orientation": {"operator": ">=", "threshold": 0.4}},
+        "severity_multiplier": -0.6,  # Positive synergy
+        "description": "Hohe Innovation und Autonomie verstärken sich gegenseitig positiv"
+    }
+}
+
+_INTERVENTION_MANDATES = {
+    "delegation_paralysis": {
+        "title": "Das Graduierte Delegations-Protokoll",
+        "urgency": 4, "timeline": "4-6 Wochen",
+        "phases": ["Micro-Delegation", "Structured Check-ins", "Responsibility Escalation"]
+    },
+    "reckless_decision_making": {
+        "title": "Das Systematische Risiko-Management-Framework", 
+        "urgency": 5, "timeline": "2-3 Wochen",
+        "phases": ["Risk Matrix Creation", "Decision Approval Process", "Risk Review Meetings"]
+    }
+}
+
+_DIM_INDEX = {dim: i for i, dim in enumerate(_DIMENSIONS)}
+_ITEM_BY_ID = {item["item_id"]: item for item in _ITEM_BANK}
+
+
+def _frozen(arr: np.ndarray) -> np.ndarray:
+    """Mark a shared lookup array read-only"""
+    arr.flags.writeable = False
+    return arr
+
+
+def _item_rows() -> Tuple[Tuple, ...]:
+    """
+    Item bank as plain tuples for item selection - the bank is small enough that a scalar
+    loop beats array dispatch
+    
+    Returns:
+        (discrimination, difficulty, dimension index, business context,
+         dimension indices of the interaction target's traits) per item
+    """
+    rows = []
+    for item in _ITEM_BANK:
+        pattern = _FRICTION_PATTERNS.get(item.get("interaction_target"))
+        inter_dims = tuple(_DIM_INDEX[trait] for trait in pattern["traits"]) if pattern else ()
+        rows.append((item["discrimination"], item.get("difficulty", 0.0), _DIM_INDEX[item["dimension"]],
+                     item["business_context"], inter_dims))
+    return tuple(rows)
+
+
+_ITEM_ROWS = _item_rows()
+
+# Context weights as vectors aligned with _DIMENSIONS, 0.5 for unweighted traits
+_CTX_WEIGHT_VEC = {
+    ctx: _frozen(np.array([weights.get(dim, 0.5) for dim in _DIMENSIONS]))
+    for ctx, weights in _TRAIT_WEIGHTS.items()
+}
+
+# Pattern conditions as (trait index, sign, threshold) tuples - sign is +1 for >=,
+# -1 for <= and 0 for operators that never fail a pattern
+_OP_SIGN = {">=": 1, "<=": -1}
+_COMPILED_PATTERNS = {
+    pattern_id: tuple(
+        (_DIM_INDEX[trait], _OP_SIGN.get(cond["operator"], 0), cond["threshold"])
+        for trait, cond in pattern["conditions"].items()
+    )
+    for pattern_id, pattern in _FRICTION_PATTERNS.items()
+}
+
+
 # Import our components (standalone versions for demo)
 class IntegratedGruenderAI:
     """
@@ -32,170 +240,30 @@ class IntegratedGruenderAI:
         self.initialize_friction_analysis()
         self.initialize_business_intelligence()
         
-        print("🚀 GründerAI Integrated Assessment System Initialized")
-        print("   ✅ Advanced IRT-CAT Engine")
-        print("   ✅ Contextual Trait Weighting")
-        print("   ✅ Friction Analysis & Intervention Mandates")
-        print("   ✅ Business Intelligence & Gründungszuschuss Optimization")
-        print("   ✅ Complete Assessment Pipeline Ready")
+        logger.debug("🚀 GründerAI Integrated Assessment System initialized: %d items, %d contexts, %d friction patterns",
+                     len(self.item_bank), len(self.trait_weights), len(self.friction_patterns))
     
     def initialize_irt_system(self):
         """Initialize IRT-CAT assessment engine"""
-        # Simplified IRT item bank for demo
-        self.item_bank = [
-            {
-                "item_id": "risk_001",
-                "dimension": "risk_taking",
-                "text_de": "Ich bin bereit, finanzielle Risiken einzugehen, um mein Geschäft voranzubringen",
-                "discrimination": 1.2,
-                "difficulty": 0.5,
-                "business_context": "general",
-                "interaction_target": "risk_achievement_friction"
-            },
-            {
-                "item_id": "autonomy_001", 
-                "dimension": "autonomy_orientation",
-                "text_de": "Ich arbeite am besten, wenn ich völlige Kontrolle über meine Aufgaben habe",
-                "discrimination": 1.4,
-                "difficulty": 0.0,
-                "business_context": "general",
-                "interaction_target": "autonomy_self_efficacy_friction"
-            },
-            {
-                "item_id": "efficacy_001",
-                "dimension": "self_efficacy", 
-                "text_de": "Ich bin zuversichtlich, auch schwierige Geschäftsprobleme lösen zu können",
-                "discrimination": 1.3,
-                "difficulty": -0.2,
-                "business_context": "general",
-                "interaction_target": "autonomy_self_efficacy_friction"
-            },
-            {
-                "item_id": "innovation_001",
-                "dimension": "innovativeness",
-                "text_de": "Ich entwickle gerne völlig neue Lösungsansätze für bestehende Probleme",
-                "discrimination": 1.1,
-                "difficulty": 0.3,
-                "business_context": "fintech",
-                "interaction_target": "innovation_autonomy_synergy"
-            },
-            {
-                "item_id": "achievement_001",
-                "dimension": "achievement_orientation",
-                "text_de": "Ich setze mir sehr hohe Leistungsstandards und arbeite hart, um sie zu erreichen",
-                "discrimination": 1.0,
-                "difficulty": 0.1,
-                "business_context": "general",
-                "interaction_target": "risk_achievement_friction"
-            },
-            {
-                "item_id": "proactive_001",
-                "dimension": "proactiveness",
-                "text_de": "Ich erkenne Geschäftschancen, bevor andere sie sehen",
-                "discrimination": 1.3,
-                "difficulty": 0.7,
-                "business_context": "ecommerce",
-                "interaction_target": "proactiveness_efficacy_friction"
-            },
-            {
-                "item_id": "competitive_001",
-                "dimension": "competitive_aggressiveness",
-                "text_de": "Ich bin entschlossen, meine Konkurrenten zu übertreffen",
-                "discrimination": 1.2,
-                "difficulty": 0.4,
-                "business_context": "general",
-                "interaction_target": "innovation_competition_friction"
-            }
-        ]
+        # Simplified IRT item bank for demo - module tables, shared across instances
+        self.item_bank = _ITEM_BANK
+        self.dimensions = _DIMENSIONS
+        self._dim_index = _DIM_INDEX
+        self._item_by_id = _ITEM_BY_ID
         
-        self.dimensions = [
-            "risk_taking", "innovativeness", "self_efficacy", 
-            "achievement_orientation", "proactiveness", 
-            "autonomy_orientation", "competitive_aggressiveness"
-        ]
+        self._item_rows = _ITEM_ROWS
     
     def initialize_contextual_scoring(self):
         """Initialize contextual trait weighting system"""
-        self.trait_weights = {
-            "fintech": {
-                "risk_taking": 0.85, "innovativeness": 0.80, "self_efficacy": 0.75,
-                "achievement_orientation": 0.70, "proactiveness": 0.65,
-                "autonomy_orientation": 0.45, "competitive_aggressiveness": 0.55
-            },
-            "consulting": {
-                "risk_taking": 0.35, "innovativeness": 0.50, "self_efficacy": 0.80,
-                "achievement_orientation": 0.75, "proactiveness": 0.70,
-                "autonomy_orientation": 0.85, "competitive_aggressiveness": 0.60
-            },
-            "restaurant": {
-                "risk_taking": 0.60, "innovativeness": 0.45, "self_efficacy": 0.70,
-                "achievement_orientation": 0.65, "proactiveness": 0.55,
-                "autonomy_orientation": 0.75, "competitive_aggressiveness": 0.50
-            },
-            "ecommerce": {
-                "risk_taking": 0.70, "innovativeness": 0.75, "self_efficacy": 0.65,
-                "achievement_orientation": 0.80, "proactiveness": 0.85,
-                "autonomy_orientation": 0.60, "competitive_aggressiveness": 0.75
-            }
-        }
-        
-        self.business_contexts = {
-            "fintech": {
-                "regulatory_complexity": 5, "capital_requirements": 250000,
-                "gruendungszuschuss_compatibility": 0.6, "approval_probability_base": 0.55
-            },
-            "consulting": {
-                "regulatory_complexity": 2, "capital_requirements": 15000,
-                "gruendungszuschuss_compatibility": 0.9, "approval_probability_base": 0.75
-            },
-            "restaurant": {
-                "regulatory_complexity": 3, "capital_requirements": 120000,
-                "gruendungszuschuss_compatibility": 0.8, "approval_probability_base": 0.65
-            },
-            "ecommerce": {
-                "regulatory_complexity": 3, "capital_requirements": 50000,
-                "gruendungszuschuss_compatibility": 0.7, "approval_probability_base": 0.60
-            }
-        }
+        self.trait_weights = _TRAIT_WEIGHTS
+        self.business_contexts = _BUSINESS_CONTEXTS
+        self._ctx_weight_vec = _CTX_WEIGHT_VEC
     
     def initialize_friction_analysis(self):
         """Initialize friction detection and intervention system"""
-        self.friction_patterns = {
-            "autonomy_self_efficacy_friction": {
-                "traits": ["autonomy_orientation", "self_efficacy"],
-                "conditions": {"autonomy_orientation": {"operator": ">=", "threshold": 0.6},
-                             "self_efficacy": {"operator": "<=", "threshold": -0.5}},
-                "severity_multiplier": 0.8,
-                "description": "Hohe Autonomie mit geringer Selbstwirksamkeit führt zu Delegationsproblemen"
-            },
-            "risk_achievement_friction": {
-                "traits": ["risk_taking", "achievement_orientation"],
-                "conditions": {"risk_taking": {"operator": ">=", "threshold": 0.5},
-                             "achievement_orientation": {"operator": "<=", "threshold": -0.3}},
-                "severity_multiplier": 0.7,
-                "description": "Hohe Risikobereitschaft ohne Leistungsorientierung führt zu unvorsichtigen Entscheidungen"
-            },
-            "innovation_autonomy_synergy": {
-                "traits": ["innovativeness", "autonomy_orientation"],
-                "conditions": {"innovativeness": {"operator": ">=", "threshold": 0.4},
-                             "autonomy_orientation": {"operator": ">=", "threshold": 0.4}},
-                "severity_multiplier": -0.6,  # Positive synergy
-                "description": "Hohe Innovation und Autonomie verstärken sich gegenseitig positiv"
-            }
-        }
-        
-        self.intervention_mandates = {
-            "delegation_paralysis": {
-                "title": "Das Graduierte Delegations-Protokoll",
-                "urgency": 4, "timeline": "4-6 Wochen",
-                "phases": ["Micro-Delegation", "Structured Check-ins", "Responsibility Escalation"]
-            },
-            "reckless_decision_making": {
-                "title": "Das Systematische Risiko-Management-Framework", 
-                "urgency": 5, "timeline": "2-3 Wochen",
-                "phases": ["Risk Matrix Creation", "Decision Approval Process", "Risk Review Meetings"]
-            }
-        }
+        self.friction_patterns = _FRICTION_PATTERNS
+        self.intervention_mandates = _INTERVENTION_MANDATES
+        self._compiled_patterns = _COMPILED_PATTERNS
     
     def initialize_business_intelligence(self):
         """Initialize business intelligence and recommendation system"""
@@ -222,6 +290,7 @@ class IntegratedGruenderAI:
             Session ID for the assessment
         """
         session_id = str(uuid.uuid4())
+        ctx_weight_vec = self._ctx_weight_vec[business_context]
         
         # Initialize session
         session = {
@@ -229,21 +298,31 @@ class IntegratedGruenderAI:
             "user_id": user_id,
             "business_context": business_context,
             "start_time": datetime.now(),
+            "start_ns": time.monotonic_ns(),
             "target_se": target_se,
             "max_items": max_items,
             
             # Assessment state
             "current_item": 0,
-            "theta_estimates": {dim: 0.0 for dim in self.dimensions},
-            "se_estimates": {dim: 1.0 for dim in self.dimensions},
+            # Aligned with self.dimensions
+            "theta_arr": np.zeros(len(self.dimensions)),
+            "se_arr": np.ones(len(self.dimensions)),
             "administered_items": [],
+            "administered_mask": np.zeros(len(self.item_bank), dtype=bool),
             "responses": [],
             
             # Context-aware features
-            "context_weights": self.trait_weights[business_context],
+            "ctx_weight_vec": ctx_weight_vec,
+            "ctx_weights": ctx_weight_vec.tolist(),
             "detected_frictions": [],
             "real_time_recommendations": [],
             
+            # Stopping rule - (trait index, required SE) of the important traits (weight >= 0.65)
+            "important_traits": tuple(
+                (dim_idx, target_se * (0.8 if weight >= 0.8 else 0.9))
+                for dim_idx, weight in enumerate(ctx_weight_vec.tolist()) if weight >= 0.65
+            ),
+            
             # Completion status
             "is_complete": False,
             "completion_reason": None
@@ -253,11 +332,8 @@ class IntegratedGruenderAI:
         self.session_analytics["total_sessions"] += 1
         self.session_analytics["context_distribution"][business_context] += 1
         
-        print(f"🎯 Assessment Session Started")
-        print(f"   Session ID: {session_id}")
-        print(f"   Business Context: {business_context}")
-        print(f"   Target SE: {target_se}")
-        print(f"   Max Items: {max_items}")
+        logger.debug("🎯 Assessment session %s started: context=%s, target_se=%s, max_items=%s",
+                     session_id, business_context, target_se, max_items)
         
         return session_id
     
@@ -280,54 +356,21 @@ class IntegratedGruenderAI:
             return self.complete_assessment(session_id)
         
         # Context-aware item selection
-        business_context = session["business_context"]
-        administered_items = set(session["administered_items"])
-        current_thetas = session["theta_estimates"]
+        best = self._select_item(session)
         
-        # Available items
-        available_items = [item for item in self.item_bank 
-                          if item["item_id"] not in administered_items]
-        
-        if not available_items:
+        if best < 0:
             return self.complete_assessment(session_id)
         
-        # Enhanced item selection algorithm
-        best_item = None
-        max_information = -1
-        
-        for item in available_items:
-            dimension = item["dimension"]
-            current_theta = current_thetas[dimension]
-            
-            # Calculate Fisher Information (simplified)
-            fisher_info = self.calculate_fisher_information(current_theta, item)
-            
-            # Apply contextual weighting
-            context_weight = session["context_weights"].get(dimension, 0.5)
-            weighted_info = fisher_info * context_weight
-            
-            # Bonus for interaction detection
-            interaction_bonus = 0.0
-            if item.get("interaction_target"):
-                interaction_bonus = self.assess_interaction_information_need(
-                    current_thetas, item["interaction_target"]
-                ) * 0.3
-            
-            # Business context preference
-            context_bonus = 0.2 if item["business_context"] == business_context else 0.0
-            
-            total_information = weighted_info + interaction_bonus + context_bonus
-            
-            if total_information > max_information:
-                max_information = total_information
-                best_item = item
+        best_item = self.item_bank[best]
         
         if best_item:
             session["administered_items"].append(best_item["item_id"])
-            session["current_item"] += 1
+            session["administered_mask"][best] = True
+            session["current_item"] = len(session["administered_items"])
             
-            # Real-time friction monitoring
-            self.monitor_real_time_friction(session)
+            # Real-time friction monitoring needs a minimum of responses
+            if len(session["responses"]) >= 3:
+                self.monitor_real_time_friction(session)
         
         return best_item
     
@@ -348,7 +391,7 @@ class IntegratedGruenderAI:
             return {"error": "Session not found"}
         
         # Find the item
-        item = next((item for item in self.item_bank if item["item_id"] == item_id), None)
+        item = self._item_by_id.get(item_id)
         if not item:
             return {"error": "Item not found"}
         
@@ -357,12 +400,12 @@ class IntegratedGruenderAI:
             "item_id": item_id,
             "dimension": item["dimension"],
             "response": response,
-            "timestamp": datetime.now()
+            "ts_ns": time.monotonic_ns()
         }
         session["responses"].append(response_data)
         
         # Update theta estimates (simplified IRT update)
-        dimension = item["dimension"]
+        dim_idx = self._dim_index[item["dimension"]]
         self.update_theta_estimate(session, item, response)
         
         # Real-time friction detection
@@ -373,11 +416,53 @@ class IntegratedGruenderAI:
         return {
             "status": "response_recorded",
             "items_completed": len(session["responses"]),
-            "current_theta": session["theta_estimates"][dimension],
+            "current_theta": float(session["theta_arr"][dim_idx]),
             "detected_frictions": len(session["detected_frictions"]),
             "assessment_complete": session["is_complete"]
         }
     
+    def _select_item(self, session: Dict) -> int:
+        """Index of the most informative item not yet administered, -1 if none is left"""
+        business_context = session["business_context"]
+        administered = session["administered_mask"].tolist()
+        thetas = session["theta_arr"].tolist()
+        ctx_weights = session["ctx_weights"]
+        # Interaction uncertainty per trait (simplified) - higher theta variability = more uncertainty
+        uncertainty = [1.0 - min(1.0, abs(theta) / 2.0) for theta in thetas]
+        
+        best = -1
+        max_information = -1
+        
+        for i, (discrimination, difficulty, dim_idx, item_context, inter_dims) in enumerate(self._item_rows):
+            if administered[i]:
+                continue
+            
+            # Fisher Information (simplified)
+            prob = 1 / (1 + math.exp(-discrimination * (thetas[dim_idx] - difficulty)))
+            fisher_info = discrimination**2 * prob * (1 - prob)
+            
+            # Apply contextual weighting
+            weighted_info = fisher_info * ctx_weights[dim_idx]
+            
+            # Bonus for interaction detection - mean uncertainty of the target's traits
+            interaction_bonus = 0.0
+            if inter_dims:
+                total_uncertainty = 0.0
+                for d in inter_dims:
+                    total_uncertainty += uncertainty[d]
+                interaction_bonus = total_uncertainty / len(inter_dims) * 0.3
+            
+            # Business context preference
+            context_bonus = 0.2 if item_context == business_context else 0.0
+            
+            total_information = weighted_info + interaction_bonus + context_bonus
+            
+            if total_information > max_information:
+                max_information = total_information
+                best = i
+        
+        return best
+    
     def calculate_fisher_information(self, theta: float, item: Dict) -> float:
         """Calculate Fisher Information for item at theta level"""
         discrimination = item["discrimination"]
@@ -391,14 +476,14 @@ class IntegratedGruenderAI:
     
     def update_theta_estimate(self, session: Dict, item: Dict, response: int):
         """Update theta estimate using simplified EAP estimation"""
-        dimension = item["dimension"]
+        dim_idx = self._dim_index[item["dimension"]]
         
         # Convert Likert response (1-5) to dichotomous (0-1)
         # Responses 4-5 = 1 (agree), 1-3 = 0 (disagree)
         binary_response = 1 if response >= 4 else 0
         
         # Simplified theta update (in practice, use proper EAP/MAP)
-        current_theta = session["theta_estimates"][dimension]
+        current_theta = float(session["theta_arr"][dim_idx])
         discrimination = item["discrimination"]
         difficulty = item.get("difficulty", 0.0)
         
@@ -410,10 +495,10 @@ class IntegratedGruenderAI:
         new_theta = current_theta + learning_rate * error
         new_theta = max(-3.0, min(3.0, new_theta))  # Bound theta
         
-        session["theta_estimates"][dimension] = new_theta
+        session["theta_arr"][dim_idx] = new_theta
         
         # Update standard error (simplified)
-        session["se_estimates"][dimension] *= 0.9  # Decrease SE with each response
+        session["se_arr"][dim_idx] *= 0.9  # Decrease SE with each response
     
     def should_stop_assessment(self, session: Dict) -> bool:
         """Determine if assessment should stop"""
@@ -423,21 +508,16 @@ class IntegratedGruenderAI:
             return True
         
         # Check SE criteria for important traits
-        target_se = session["target_se"]
-        context_weights = session["context_weights"]
+        important_traits = session["important_traits"]
+        se_estimates = session["se_arr"].tolist()
         
         important_traits_ready = 0
-        total_important_traits = 0
-        
-        for dimension, se in session["se_estimates"].items():
-            weight = context_weights.get(dimension, 0.5)
-            if weight >= 0.65:  # Important trait
-                total_important_traits += 1
-                required_se = target_se * (0.8 if weight >= 0.8 else 0.9)
-                if se <= required_se:
-                    important_traits_ready += 1
+        for dim_idx, required_se in important_traits:
+            if se_estimates[dim_idx] <= required_se:
+                important_traits_ready += 1
         
         # Stop if 80% of important traits are ready
+        total_important_traits = len(important_traits)
         if total_important_traits > 0:
             readiness_ratio = important_traits_ready / total_important_traits
             if readiness_ratio >= 0.8:
@@ -455,35 +535,30 @@ class IntegratedGruenderAI:
         if len(session["responses"]) < 3:  # Need minimum responses
             return
         
-        current_thetas = session["theta_estimates"]
+        current_thetas = session["theta_arr"].tolist()
+        existing = {f["pattern_id"] for f in session["detected_frictions"]}
         
-        for pattern_id, pattern in self.friction_patterns.items():
-            friction_detected = True
+        for pattern_id, conditions in self._compiled_patterns.items():
+            # Skip patterns that were already detected
+            if pattern_id in existing:
+                continue
             
-            for trait, condition in pattern["conditions"].items():
-                trait_theta = current_thetas.get(trait, 0.0)
-                threshold = condition["threshold"]
-                operator = condition["operator"]
-                
-                if operator == ">=" and trait_theta < threshold:
-                    friction_detected = False
-                    break
-                elif operator == "<=" and trait_theta > threshold:
+            friction_detected = True
+            for dim_idx, sign, threshold in conditions:
+                if sign * (current_thetas[dim_idx] - threshold) < 0:
                     friction_detected = False
                     break
             
             if friction_detected:
-                # Check if already detected
-                existing = any(f["pattern_id"] == pattern_id for f in session["detected_frictions"])
-                if not existing:
-                    friction = {
-                        "pattern_id": pattern_id,
-                        "detection_time": datetime.now(),
-                        "description": pattern["description"],
-                        "severity": abs(pattern["severity_multiplier"]),
-                        "type": "synergy" if pattern["severity_multiplier"] < 0 else "friction"
-                    }
-                    session["detected_frictions"].append(friction)
+                pattern = self.friction_patterns[pattern_id]
+                friction = {
+                    "pattern_id": pattern_id,
+                    "detection_ns": time.monotonic_ns(),
+                    "description": pattern["description"],
+                    "severity": abs(pattern["severity_multiplier"]),
+                    "type": "synergy" if pattern["severity_multiplier"] < 0 else "friction"
+                }
+                session["detected_frictions"].append(friction)
     
     def detect_real_time_friction(self, session: Dict) -> List[Dict]:
         """Detect new friction patterns"""
@@ -516,17 +591,28 @@ class IntegratedGruenderAI:
             return {"error": "Session not found"}
         
         session["is_complete"] = True
-        session["end_time"] = datetime.now()
-        session["completion_time"] = session["end_time"] - session["start_time"]
+        # Monotonic timestamps become datetimes only here, at the session boundary
+        start_ns = session["start_ns"]
+        session["completion_time"] = timedelta(microseconds=(time.monotonic_ns() - start_ns) // 1000)
+        session["end_time"] = session["start_time"] + session["completion_time"]
+        for response in session["responses"]:
+            if "ts_ns" in response:
+                response["timestamp"] = session["start_time"] + timedelta(
+                    microseconds=(response.pop("ts_ns") - start_ns) // 1000
+                )
+        for friction in session["detected_frictions"]:
+            if "detection_ns" in friction:
+                friction["detection_time"] = session["start_time"] + timedelta(
+                    microseconds=(friction.pop("detection_ns") - start_ns) // 1000
+                )
         
         # Generate comprehensive analysis
         analysis = self.generate_comprehensive_analysis(session)
         session["final_analysis"] = analysis
         
-        print(f"✅ Assessment Complete - Session {session_id}")
-        print(f"   Duration: {session['completion_time']}")
-        print(f"   Items Administered: {len(session['responses'])}")
-        print(f"   Reason: {session.get('completion_reason', 'unknown')}")
+        logger.debug("✅ Assessment session %s complete: duration=%s, items=%d, reason=%s",
+                     session_id, session["completion_time"], len(session["responses"]),
+                     session.get("completion_reason", "unknown"))
         
         return {
             "status": "assessment_complete",
@@ -537,7 +623,8 @@ class IntegratedGruenderAI:
     def generate_comprehensive_analysis(self, session: Dict) -> Dict:
         """Generate comprehensive business intelligence analysis"""
         business_context = session["business_context"]
-        theta_estimates = session["theta_estimates"]
+        # Dict views of the theta / SE arrays for the report
+        theta_estimates = dict(zip(self.dimensions, session["theta_arr"].tolist()))
         detected_frictions = session["detected_frictions"]
         
         # 1. Contextual scoring analysis
@@ -578,10 +665,10 @@ class IntegratedGruenderAI:
             },
             "personality_profile": {
                 "trait_scores": theta_estimates,
-                "trait_percentiles": {dim: self.theta_to_percentile(theta) 
-                                   for dim, theta in theta_estimates.items()},
+                "trait_percentiles": dict(zip(self.dimensions,
+                                              self.theta_to_percentile(session["theta_arr"]).tolist())),
                 "dominant_traits": self.identify_dominant_traits(theta_estimates),
-                "trait_reliability": session["se_estimates"]
+                "trait_reliability": dict(zip(self.dimensions, session["se_arr"].tolist()))
             },
             "contextual_analysis": contextual_analysis,
             "friction_analysis": friction_analysis,
@@ -597,29 +684,31 @@ class IntegratedGruenderAI:
     
     def calculate_context_weighted_scores(self, theta_scores: Dict, business_context: str) -> Dict:
         """Calculate context-weighted trait scores"""
-        context_weights = self.trait_weights[business_context]
-        
-        weighted_scores = {}
-        total_weighted = 0.0
-        total_weight = 0.0
-        
-        for trait, theta in theta_scores.items():
-            weight = context_weights.get(trait, 0.5)
-            normalized = (theta + 3.0) / 6.0  # Convert to 0-1
-            weighted_score = normalized * weight
-            
-            weighted_scores[trait] = {
-                "raw_theta": theta,
-                "normalized": normalized,
+        traits = tuple(theta_scores)
+        theta = np.fromiter(theta_scores.values(), dtype=np.float64, count=len(traits))
+        if traits == self.dimensions:
+            weights = self._ctx_weight_vec[business_context]
+        else:
+            context_weights = self.trait_weights[business_context]
+            weights = np.array([context_weights.get(trait, 0.5) for trait in traits], dtype=np.float64)
+        
+        normalized = (theta + 3.0) / 6.0  # Convert to 0-1
+        weighted = normalized * weights
+        total_weight = weights.sum()
+        context_fitness = float(weighted.sum() / total_weight) if total_weight > 0 else 0.5
+        
+        weighted_scores = {
+            trait: {
+                "raw_theta": raw_theta,
+                "normalized": norm,
                 "weight": weight,
                 "weighted_score": weighted_score,
                 "importance": "critical" if weight >= 0.8 else "high" if weight >= 0.65 else "moderate"
             }
-            
-            total_weighted += weighted_score
-            total_weight += weight
-        
-        context_fitness = total_weighted / total_weight if total_weight > 0 else 0.5
+            for trait, raw_theta, norm, weight, weighted_score in zip(
+                traits, theta.tolist(), normalized.tolist(), weights.tolist(), weighted.tolist()
+            )
+        }
         
         return {
             "business_context": business_context,
@@ -631,12 +720,19 @@ class IntegratedGruenderAI:
     def analyze_detected_frictions(self, detected_frictions: List, theta_scores: Dict, 
                                  business_context: str) -> Dict:
         """Analyze detected friction patterns"""
-        friction_score = sum(f["severity"] for f in detected_frictions if f["type"] == "friction")
-        synergy_score = sum(f["severity"] for f in detected_frictions if f["type"] == "synergy")
+        total_frictions = total_synergies = 0
+        friction_score = synergy_score = 0
+        for f in detected_frictions:
+            if f["type"] == "friction":
+                total_frictions += 1
+                friction_score += f["severity"]
+            elif f["type"] == "synergy":
+                total_synergies += 1
+                synergy_score += f["severity"]
         
         return {
-            "total_frictions": len([f for f in detected_frictions if f["type"] == "friction"]),
-            "total_synergies": len([f for f in detected_frictions if f["type"] == "synergy"]),
+            "total_frictions": total_frictions,
+            "total_synergies": total_synergies,
             "friction_score": friction_score,
             "synergy_score": synergy_score,
             "net_friction": friction_score - synergy_score,
@@ -757,8 +853,10 @@ class IntegratedGruenderAI:
         }
     
     # Helper methods
-    def theta_to_percentile(self, theta: float) -> int:
-        """Convert theta to percentile rank"""
+    def theta_to_percentile(self, theta: Union[float, np.ndarray]) -> Union[int, np.ndarray]:
+        """Convert theta (or an array of thetas) to percentile rank"""
+        if isinstance(theta, np.ndarray):
+            return np.clip(((theta + 3) / 6 * 100).astype(np.int64), 1, 99)
         return max(1, min(99, int((theta + 3) / 6 * 100)))
     
     def identify_dominant_traits(self, theta_scores: Dict) -> List[str]:
@@ -1037,5 +1135,10 @@ def run_comprehensive_demo():
     return analysis
 
 if __name__ == "__main__":
+    import sys
+    
+    # --verbose shows the system's own DEBUG logging
+    logging.basicConfig(level=logging.DEBUG if "--verbose" in sys.argv else logging.INFO, format="%(message)s")
+    
     # Run the comprehensive demonstration
     final_analysis = run_comprehensive_demo()
\ No newline at end of file
@@ -97,6 +97,12 @@ class IRTCATEngine:
         normalized = (theta + 3.0) / 6.0  # 0 to 1
         percentile = int(normalized * 98) + 1  # 1 to 99
         return max(1, min(99, percentile))
+    
+    def theta_to_percentile_batch(self, thetas: np.ndarray) -> np.ndarray:
+        """Convert an array of thetas to percentiles in one pass"""
+        normalized = (np.asarray(thetas, dtype=np.float64) + 3.0) / 6.0
+        percentiles = np.trunc(normalized * 98).astype(np.int64) + 1  # int() truncates toward zero
+        return np.clip(percentiles, 1, 99)
 
 # Test the engine
 if __name__ == "__main__":
@@ -0,0 +1,20 @@
+"""
+Shared pytest setup - the engines import their siblings as top-level modules
+"""
+
+import os
+import sys
+
+ENGINE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src", "assessment_engine")
+if ENGINE_DIR not in sys.path:
+    sys.path.insert(0, ENGINE_DIR)
+
+TRAITS = (
+    "risk_taking",
+    "innovativeness",
+    "self_efficacy",
+    "achievement_orientation",
+    "proactiveness",
+    "autonomy_orientation",
+    "competitive_aggressiveness",
+)
@@ -0,0 +1,99 @@
+"""
+Contextual demo engine against a scalar reference of its fitness model
+"""
+
+import random
+
+import pytest
+
+from conftest import TRAITS
+
+from contextual_demo import GruenderAIContextualDemo
+
+CONTEXTS = ("fintech", "consulting", "restaurant", "ecommerce")
+
+
+def _reference_analysis(engine, theta_scores, context):
+    """Scalar per-trait loop over the context's weight table"""
+    weights = engine.trait_weights[context]
+    info = engine.business_contexts[context]
+    total_weighted = 0.0
+    total_weight = 0.0
+    critical = []
+    traits = {}
+    for trait, raw_theta in theta_scores.items():
+        weight = weights[trait]
+        normalized = (raw_theta + 3.0) / 6.0
+        weighted = normalized * weight
+        importance = ("KRITISCH" if weight >= 0.75 else "HOCH" if weight >= 0.65
+                      else "MODERAT" if weight >= 0.5 else "NIEDRIG")
+        performance = "STARK" if normalized >= 0.7 else "AUSREICHEND" if normalized >= 0.5 else "SCHWACH"
+        traits[trait] = (normalized, weighted, importance, performance)
+        total_weighted += weighted
+        total_weight += weight
+        if weight >= 0.75:
+            critical.append(normalized)
+
+    fitness = total_weighted / total_weight if total_weight > 0 else 0.5
+    readiness = sum(critical) / len(critical) if critical else 0.5
+    adjusted = fitness * 0.7 + readiness * 0.3
+    probability = max(0.25, min(0.95, info["approval_probability_base"] + (adjusted - 0.5) * 0.4
+                                + (info["gruendungszuschuss_compatibility"] - 0.7) * 0.1))
+    return traits, adjusted, readiness, probability
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return GruenderAIContextualDemo()
+
+
+def _profiles(n=200, seed=3):
+    rng = random.Random(seed)
+    profiles = [{trait: rng.uniform(-3.0, 3.0) for trait in TRAITS} for _ in range(n)]
+    profiles.append({trait: 0.0 for trait in TRAITS})
+    profiles.append({trait: rng.uniform(-3.0, 3.0) for trait in TRAITS[2:5]})
+    profiles.append({})
+    return profiles
+
+
+@pytest.mark.parametrize("context", CONTEXTS)
+def test_analysis_matches_scalar_reference(engine, context):
+    for profile in _profiles():
+        result = engine.analyze_personality_for_context(profile, context)
+        traits, adjusted, readiness, probability = _reference_analysis(engine, profile, context)
+
+        assert result["business_fitness"]["score"] == pytest.approx(adjusted, rel=1e-12)
+        assert result["business_fitness"]["critical_traits_readiness"] == pytest.approx(readiness, rel=1e-12)
+        assert result["gruendungszuschuss"]["probability"] == pytest.approx(probability, rel=1e-12)
+        assert set(result["trait_analysis"]) == set(traits)
+        for trait, (normalized, weighted, importance, performance) in traits.items():
+            record = result["trait_analysis"][trait]
+            assert record.normalized_score == pytest.approx(normalized, rel=1e-12)
+            assert record.weighted_score == pytest.approx(weighted, rel=1e-12)
+            assert record.business_impact == pytest.approx(weighted * 100, rel=1e-12)
+            assert record.importance == importance
+            assert record.performance == performance
+
+
+def test_compare_matches_per_context_analysis(engine):
+    for profile in _profiles(n=20):
+        comparison = engine.compare_contexts(profile, list(CONTEXTS))
+        assert list(comparison) == list(CONTEXTS)
+        for context, result in comparison.items():
+            assert result == engine.analyze_personality_for_context(profile, context)
+
+
+def test_unknown_traits_are_rejected(engine):
+    with pytest.raises(KeyError, match="locus_of_control"):
+        engine.analyze_personality_for_context({"risk_taking": 0.5, "locus_of_control": 1.0}, "fintech")
+
+
+def test_results_are_independent_of_earlier_calls(engine):
+    profile = _profiles(n=1)[0]
+    first = engine.analyze_personality_for_context(profile, "fintech")
+    first["context_info"]["approval_probability_base"] = 0.0
+    first["business_fitness"]["score"] = -1.0
+
+    second = engine.analyze_personality_for_context(profile, "fintech")
+    assert second["context_info"]["approval_probability_base"] == engine.business_contexts["fintech"]["approval_probability_base"]
+    assert second["business_fitness"]["score"] >= 0.0
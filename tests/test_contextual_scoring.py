@@ -0,0 +1,130 @@
+"""
+Contextual scoring engine against a scalar reference of the per-trait scoring rules
+"""
+
+import os
+import random
+
+import numpy as np
+import pytest
+
+from conftest import TRAITS
+
+import contextual_scoring
+
+
+def _reference_scores(theta_scores, weights, regulatory_complexity):
+    """Scalar per-trait loop: (normalized, weighted, importance, percentile, risk level) and fitness"""
+    traits = {}
+    total_weighted = 0.0
+    total_weight = 0.0
+    critical_scores = []
+    for dimension, raw_theta in theta_scores.items():
+        weight = weights.get(dimension, 0.5)
+        normalized = (max(-3.0, min(3.0, raw_theta)) + 3.0) / 6.0
+        weighted = normalized * weight
+        if weight >= 0.8:
+            importance = "critical"
+        elif weight >= 0.65:
+            importance = "high"
+        elif weight >= 0.5:
+            importance = "moderate"
+        elif weight >= 0.35:
+            importance = "low"
+        else:
+            importance = "minimal"
+        if weight >= 0.75:
+            risk = "high" if normalized < 0.4 else "moderate" if normalized < 0.6 else "low"
+            critical_scores.append(normalized)
+        else:
+            risk = "moderate" if normalized < 0.3 else "low"
+        percentile = max(1, min(99, int((raw_theta + 3) / 6 * 100)))
+        traits[dimension] = (normalized, weighted, importance, percentile, risk)
+        total_weighted += weighted
+        total_weight += weight
+
+    base_fitness = total_weighted / total_weight if total_weight > 0 else 0.5
+    ready = sum(1 for score in critical_scores if score >= 0.6)
+    critical_ratio = ready / len(critical_scores) if critical_scores else 1.0
+    fitness = max(0.0, min(1.0, base_fitness * critical_ratio * (1.0 - (regulatory_complexity - 1) * 0.05)))
+    return traits, fitness
+
+
+@pytest.fixture(scope="module")
+def engine(tmp_path_factory):
+    models = contextual_scoring._enhanced_models()
+    if models is None:
+        pytest.skip("enhanced models (SQLAlchemy) not available")
+
+    db_dir = tmp_path_factory.mktemp("scoring")
+    cwd = os.getcwd()
+    os.chdir(db_dir)  # DatabaseManager opens sqlite:///./<file>
+    try:
+        models.EnhancedDatabaseManager("scoring.db").create_enhanced_tables()
+        scoring_engine = contextual_scoring.ContextualScoringEngine("scoring.db")
+    finally:
+        os.chdir(cwd)
+    yield scoring_engine
+    scoring_engine.close()
+
+
+def _profiles(n=50, seed=7):
+    rng = random.Random(seed)
+    profiles = [{trait: rng.uniform(-4.0, 4.0) for trait in TRAITS} for _ in range(n)]
+    profiles.append({trait: 0.0 for trait in TRAITS})
+    profiles.append({trait: rng.uniform(-3.0, 3.0) for trait in TRAITS[:4]})
+    return profiles
+
+
+@pytest.mark.parametrize("context", ["fintech", "consulting", "restaurant", "ecommerce"])
+def test_weighted_scores_match_scalar_reference(engine, context):
+    weights = engine.trait_weights[context]
+    complexity = engine.business_contexts[context].regulatory_complexity
+    for profile in _profiles():
+        result = engine.calculate_context_weighted_scores(profile, context)
+        expected_traits, expected_fitness = _reference_scores(profile, weights, complexity)
+
+        assert list(result["weighted_trait_analysis"]) == list(profile)
+        for dimension, (normalized, weighted, importance, percentile, risk) in expected_traits.items():
+            analysis = result["weighted_trait_analysis"][dimension]
+            assert analysis["normalized_score"] == pytest.approx(normalized, rel=1e-12)
+            assert analysis["weighted_score"] == pytest.approx(weighted, rel=1e-12)
+            assert analysis["importance_level"] == importance
+            assert analysis["percentile_rank"] == percentile
+            assert analysis["risk_assessment"]["level"] == risk
+        assert result["overall_fitness"]["context_fitness_score"] == pytest.approx(expected_fitness, rel=1e-12)
+
+
+def test_analyze_contexts_matches_single_context_scoring(engine):
+    contexts = ["fintech", "restaurant", "fintech", "consulting"]
+    for profile in _profiles(n=10):
+        results = engine.analyze_contexts(profile, contexts)
+        assert list(results) == ["fintech", "restaurant", "consulting"]
+        for context, result in results.items():
+            assert result == engine.calculate_context_weighted_scores(profile, context)
+
+
+def test_vector_input_matches_dict_input(engine):
+    profile = _profiles(n=1)[0]
+    vector = np.array([profile[dim] for dim in engine.dim_order])
+    by_dict = engine.calculate_context_weighted_scores({dim: profile[dim] for dim in engine.dim_order}, "fintech")
+    by_vector = engine.calculate_context_weighted_scores(vector, "fintech")
+    assert by_vector["overall_fitness"] == by_dict["overall_fitness"]
+
+
+def test_results_are_independent_of_earlier_calls(engine):
+    profile = _profiles(n=1)[0]
+    first = engine.calculate_context_weighted_scores(profile, "fintech")
+    first["context_info"]["critical_success_factors"].append("mutated")
+    first["overall_fitness"]["context_fitness_score"] = -1.0
+
+    second = engine.calculate_context_weighted_scores(profile, "fintech")
+    assert "mutated" not in second["context_info"]["critical_success_factors"]
+    assert second["overall_fitness"]["context_fitness_score"] >= 0.0
+
+
+def test_theta_vector_shape_is_checked(engine):
+    with pytest.raises(ValueError):
+        engine.calculate_context_weighted_scores(np.zeros(len(engine.dim_order) - 1), "fintech")
+    with pytest.raises(ValueError):
+        engine._coerce_theta(np.zeros((1, len(engine.dim_order))))
@@ -0,0 +1,140 @@
+"""
+Friction detection - every entry point against a scalar reference of the pattern rules
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from conftest import TRAITS
+
+from friction_analysis import FrictionAnalysisEngine
+
+CONTEXTS = ("general", "fintech", "consulting", "restaurant", "ecommerce")
+
+
+def _reference_detect(patterns, theta_scores, context):
+    """[(pattern_id, severity, strength)] in pattern order, one condition at a time"""
+    hits = []
+    for pattern_id, pattern in patterns.items():
+        if "all" not in pattern["business_contexts"] and context not in pattern["business_contexts"]:
+            continue
+        strength = 0.0
+        for trait, condition in pattern["conditions"].items():
+            score = theta_scores.get(trait, 0.0)
+            if condition["operator"] == ">=" and score >= condition["threshold"]:
+                strength += score - condition["threshold"]
+            elif condition["operator"] == "<=" and score <= condition["threshold"]:
+                strength += abs(score - condition["threshold"])
+            else:
+                break
+        else:
+            strength_factor = strength / len(pattern["traits"])
+            severity = min(1.0, abs(pattern["severity_multiplier"]) * (1 + strength_factor))
+            hits.append((pattern_id, severity, strength_factor))
+    return hits
+
+
+def _sorted_by_severity(hits):
+    return sorted(hits, key=lambda hit: hit[1], reverse=True)
+
+
+def _as_hits(interactions):
+    return [(i["pattern_id"], i["severity"], i["strength"]) for i in interactions]
+
+
+def _assert_hits_equal(actual, expected):
+    assert [hit[0] for hit in actual] == [hit[0] for hit in expected]
+    for (_, severity, strength), (_, ref_severity, ref_strength) in zip(actual, expected):
+        assert severity == pytest.approx(ref_severity, rel=1e-12, abs=1e-15)
+        assert strength == pytest.approx(ref_strength, rel=1e-12, abs=1e-15)
+
+
+@pytest.fixture
+def engine():
+    return FrictionAnalysisEngine()
+
+
+def _profiles(n=300, seed=11):
+    rng = random.Random(seed)
+    profiles = [{trait: round(rng.uniform(-2.0, 2.0), rng.choice([1, 3])) for trait in TRAITS} for _ in range(n)]
+    profiles.append({trait: 0.0 for trait in TRAITS})
+    profiles.append({"autonomy_orientation": 1.5, "self_efficacy": -1.0})
+    return profiles
+
+
+@pytest.mark.parametrize("context", CONTEXTS)
+def test_detect_matches_scalar_reference(engine, context):
+    for profile in _profiles():
+        expected = _sorted_by_severity(_reference_detect(engine.friction_patterns, profile, context))
+        _assert_hits_equal(_as_hits(engine.detect_trait_interactions(profile, context)), expected)
+
+
+def test_detect_split_partitions_by_interaction_type(engine):
+    for profile in _profiles(n=100):
+        interactions = engine.detect_trait_interactions(profile, "fintech")
+        frictions, synergies = engine.detect_trait_interactions(profile, "fintech", split=True)
+        assert _as_hits(frictions) == [hit for hit in _as_hits(interactions)
+                                       if engine.friction_patterns[hit[0]]["severity_multiplier"] >= 0]
+        assert _as_hits(synergies) == [hit for hit in _as_hits(interactions)
+                                       if engine.friction_patterns[hit[0]]["severity_multiplier"] < 0]
+
+
+def test_comprehensive_analysis_matches_scalar_reference(engine):
+    for profile in _profiles(n=100):
+        expected = _reference_detect(engine.friction_patterns, profile, "ecommerce")
+        analysis = engine.generate_comprehensive_friction_analysis(profile, "ecommerce")
+        frictions = [hit for hit in expected if engine.friction_patterns[hit[0]]["severity_multiplier"] >= 0]
+        synergies = [hit for hit in expected if engine.friction_patterns[hit[0]]["severity_multiplier"] < 0]
+
+        _assert_hits_equal(_as_hits(analysis["detected_frictions"]), _sorted_by_severity(frictions))
+        _assert_hits_equal(_as_hits(analysis["detected_synergies"]), _sorted_by_severity(synergies))
+        overall = analysis["overall_friction_analysis"]
+        assert overall["friction_score"] == pytest.approx(sum(hit[1] for hit in frictions), rel=1e-12)
+        assert overall["total_interactions"] == len(expected)
+
+
+def test_score_profiles_matches_scalar_reference(engine):
+    profiles = _profiles()
+    rng = random.Random(5)
+    ctx_ids = np.array([rng.randrange(len(engine.context_names)) for _ in profiles])
+    theta = np.array([[profile.get(trait, 0.0) for trait in engine.trait_index] for profile in profiles])
+
+    for batch in (engine.score_profiles(theta, ctx_ids), engine.score_profiles(profiles, ctx_ids)):
+        for profile, ctx_id, interactions in zip(profiles, ctx_ids, batch):
+            context = engine.context_names[ctx_id]
+            expected = _sorted_by_severity(_reference_detect(engine.friction_patterns, profile, context))
+            _assert_hits_equal(_as_hits(interactions), expected)
+
+
+def test_net_friction_matches_scalar_reference(engine):
+    for profile in _profiles():
+        net = engine.net_friction_by_context(profile)
+        for context, value in zip(engine.context_names, net.tolist()):
+            expected = sum(-severity if engine.friction_patterns[pattern_id]["severity_multiplier"] < 0 else severity
+                           for pattern_id, severity, _ in _reference_detect(engine.friction_patterns, profile, context))
+            assert value == pytest.approx(expected, rel=1e-12, abs=1e-15)
+
+
+def test_refresh_patterns_invalidates_cached_hits(engine):
+    profile = {"autonomy_orientation": 1.5, "self_efficacy": -1.0}
+    before = engine.generate_comprehensive_friction_analysis(profile, "general")
+    assert "autonomy_self_efficacy_friction" in [i["pattern_id"] for i in before["detected_frictions"]]
+
+    engine.friction_patterns["autonomy_self_efficacy_friction"]["conditions"]["autonomy_orientation"]["threshold"] = 2.0
+    engine.refresh_patterns()
+
+    after = engine.generate_comprehensive_friction_analysis(profile, "general")
+    assert "autonomy_self_efficacy_friction" not in [i["pattern_id"] for i in after["detected_frictions"]]
+    assert _as_hits(engine.detect_trait_interactions(profile, "general")) == _as_hits(after["detected_frictions"])
+
+
+def test_results_are_independent_of_earlier_calls(engine):
+    profile = {"autonomy_orientation": 1.5, "self_efficacy": -1.0}
+    first = engine.generate_comprehensive_friction_analysis(profile, "general")
+    first["detected_frictions"][0]["severity"] = -1.0
+    first["detected_frictions"].clear()
+
+    second = engine.generate_comprehensive_friction_analysis(profile, "general")
+    assert second["detected_frictions"] and second["detected_frictions"][0]["severity"] > 0
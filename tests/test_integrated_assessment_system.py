@@ -0,0 +1,107 @@
+"""
+CAT item selection and stopping rule against scalar references of the selection rules
+"""
+
+import math
+import random
+
+import numpy as np
+import pytest
+
+from integrated_assessment_system import IntegratedGruenderAI
+
+CONTEXTS = ("fintech", "consulting", "restaurant", "ecommerce")
+
+
+def _reference_next_item(system, session):
+    """Item id with the highest context-weighted information, first one on ties"""
+    thetas = dict(zip(system.dimensions, session["theta_arr"].tolist()))
+    weights = system.trait_weights[session["business_context"]]
+    best_item, max_information = None, -1
+    for item in system.item_bank:
+        if item["item_id"] in session["administered_items"]:
+            continue
+        theta = thetas[item["dimension"]]
+        prob = 1 / (1 + math.exp(-item["discrimination"] * (theta - item.get("difficulty", 0.0))))
+        information = item["discrimination"]**2 * prob * (1 - prob) * weights.get(item["dimension"], 0.5)
+        target = item.get("interaction_target")
+        if target in system.friction_patterns:
+            traits = system.friction_patterns[target]["traits"]
+            information += sum(1.0 - min(1.0, abs(thetas[trait]) / 2.0) for trait in traits) / len(traits) * 0.3
+        if item["business_context"] == session["business_context"]:
+            information += 0.2
+        if information > max_information:
+            best_item, max_information = item["item_id"], information
+    return best_item
+
+
+def _reference_should_stop(system, session):
+    if session["current_item"] >= session["max_items"]:
+        return True
+    weights = system.trait_weights[session["business_context"]]
+    ready = total = 0
+    for dimension, se in zip(system.dimensions, session["se_arr"].tolist()):
+        weight = weights.get(dimension, 0.5)
+        if weight >= 0.65:
+            total += 1
+            if se <= session["target_se"] * (0.8 if weight >= 0.8 else 0.9):
+                ready += 1
+    return total > 0 and ready / total >= 0.8
+
+
+@pytest.fixture
+def system():
+    return IntegratedGruenderAI()
+
+
+@pytest.mark.parametrize("context", CONTEXTS)
+def test_item_selection_matches_scalar_reference(system, context):
+    rng = random.Random(context)
+    for _ in range(200):
+        session = system.assessment_sessions[system.start_adaptive_assessment("u", context, max_items=50)]
+        session["theta_arr"][:] = [rng.uniform(-3.0, 3.0) for _ in system.dimensions]
+        for index in rng.sample(range(len(system.item_bank)), rng.randrange(len(system.item_bank))):
+            session["administered_items"].append(system.item_bank[index]["item_id"])
+            session["administered_mask"][index] = True
+
+        best = system._select_item(session)
+        assert system.item_bank[best]["item_id"] == _reference_next_item(system, session)
+
+
+def test_item_selection_returns_minus_one_when_bank_is_exhausted(system):
+    session = system.assessment_sessions[system.start_adaptive_assessment("u", "fintech")]
+    session["administered_mask"][:] = True
+    assert system._select_item(session) == -1
+
+
+@pytest.mark.parametrize("context", CONTEXTS)
+def test_stopping_rule_matches_scalar_reference(system, context):
+    rng = random.Random(context)
+    for _ in range(200):
+        target_se = rng.choice([0.2, 0.5, 0.9])
+        session = system.assessment_sessions[
+            system.start_adaptive_assessment("u", context, target_se=target_se, max_items=rng.randint(3, 15))
+        ]
+        session["se_arr"][:] = [0.9 ** rng.randrange(12) for _ in system.dimensions]
+        session["current_item"] = rng.randrange(16)
+
+        assert system.should_stop_assessment(session) == _reference_should_stop(system, session)
+
+
+@pytest.mark.parametrize("response", [1, 5])
+def test_session_runs_to_completion(system, response):
+    session_id = system.start_adaptive_assessment("u", "fintech", max_items=5)
+    session = system.assessment_sessions[session_id]
+    while True:
+        expected = None if session["is_complete"] else _reference_next_item(system, session)
+        item = system.get_next_item(session_id)
+        if item is None or "item_id" not in item:
+            break
+        if not session["is_complete"]:
+            assert item["item_id"] == expected
+        system.submit_response(session_id, item["item_id"], response)
+
+    assert session["is_complete"]
+    assert len(session["responses"]) == 5
+    assert all("ts_ns" not in r and r["timestamp"] >= session["start_time"] for r in session["responses"])
+    assert np.all(np.abs(session["theta_arr"]) <= 3.0)